@@ -0,0 +1,70 @@
+"""
+测试脚本共用的夹具。
+
+同一进程内，同一文件、同一提取配置只提取一次；DWG 测试共用一个
+DWGExtractor，只连接一次 AutoCAD，进程退出时统一释放。
+"""
+
+import atexit
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from dwg_extractor import DWGExtractor
+from dxf_extractor import DXFExtractor
+
+_ConfigKey = Tuple[Tuple[str, bool], ...]
+
+
+def _config_key(extract_config: Optional[Dict[str, bool]]) -> _ConfigKey:
+    """把提取配置转换为可哈希的缓存键"""
+    return tuple(sorted((extract_config or {}).items()))
+
+
+@lru_cache(maxsize=1)
+def get_dwg_extractor() -> DWGExtractor:
+    """返回进程内共享的 DWGExtractor，进程退出时调用 close()"""
+    extractor = DWGExtractor()
+    atexit.register(extractor.close)
+    return extractor
+
+
+def load_dwg(
+    dwg_path: str, extract_config: Optional[Dict[str, bool]] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """提取 DWG 文件元素，同一文件和配置只提取一次"""
+    return _load_dwg_cached(dwg_path, _config_key(extract_config))[0]
+
+
+def load_dwg_all_elements(
+    dwg_path: str, extract_config: Optional[Dict[str, bool]] = None
+) -> List[Dict[str, Any]]:
+    """返回与 load_dwg 同一次提取得到的 get_all_elements() 结果"""
+    return _load_dwg_cached(dwg_path, _config_key(extract_config))[1]
+
+
+@lru_cache(maxsize=4)
+def _load_dwg_cached(
+    dwg_path: str, config_key: _ConfigKey
+) -> Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    extractor = get_dwg_extractor()
+    elements = extractor.extract_from_file(dwg_path, dict(config_key))
+    # 提取器在下次提取时会原地清空元素列表，缓存的是列表副本；
+    # get_all_elements() 读取的也是提取器的当前状态，须在同一次提取后立即调用
+    return (
+        {name: list(bucket) for name, bucket in elements.items()},
+        extractor.get_all_elements(),
+    )
+
+
+def load_dxf(
+    dxf_path: str, extract_config: Optional[Dict[str, bool]] = None
+) -> DXFExtractor:
+    """打开并提取 DXF 文件，返回提取器；同一文件和配置只提取一次"""
+    return _load_dxf_cached(dxf_path, _config_key(extract_config))
+
+
+@lru_cache(maxsize=4)
+def _load_dxf_cached(dxf_path: str, config_key: _ConfigKey) -> DXFExtractor:
+    extractor = DXFExtractor(dxf_path)
+    extractor.extract(dict(config_key) or None)
+    return extractor
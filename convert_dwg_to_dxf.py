@@ -6,18 +6,192 @@ DWG 转 DXF 转换工具
 """
 
 import sys
+import time
 import logging
 from pathlib import Path
-from logging_config import setup_logger
+from logging_config import forward_worker_logs, init_worker_logging, setup_logger
 
 
-def convert_dwg_to_dxf(dwg_dir="dwg", dxf_dir="dxf"):
+# 尝试多个可能的 AutoCAD 版本
+AUTOCAD_VERSIONS = [
+    "AutoCAD.Application.24",  # AutoCAD 2024
+    "AutoCAD.Application.23",  # AutoCAD 2023
+    "AutoCAD.Application.22",  # AutoCAD 2022
+    "AutoCAD.Application",  # 通用版本
+]
+
+# AcSaveAsType.ac2013_dxf
+AC_2013_DXF = 61
+
+# 并行转换时，每个工作进程持有自己的 AutoCAD 实例
+_worker_acad = None
+
+
+def _connect_autocad(new_instance=False):
+    """
+    连接 AutoCAD
+
+    Args:
+        new_instance: 为 True 时使用 DispatchEx 启动独立的 AutoCAD 进程，
+            否则使用 Dispatch（可能复用已运行的实例）
+
+    Returns:
+        (AutoCAD 应用对象, 使用的版本标识)，连接失败时为 (None, None)
+    """
+    import win32com.client
+
+    dispatch = win32com.client.DispatchEx if new_instance else win32com.client.Dispatch
+    for version in AUTOCAD_VERSIONS:
+        try:
+            acad = dispatch(version)
+            acad.Visible = False  # 后台运行
+            return acad, version
+        except Exception:
+            continue
+    return None, None
+
+
+def _wait_for_stable(path, timeout=30, interval=0.1, settle=0.5):
+    """
+    轮询等待文件写入完成：文件存在、非空且大小在 settle 秒内不再变化
+
+    Returns:
+        在超时前文件稳定返回 True，否则返回 False
+    """
+    last_size = -1
+    stable_since = None
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            size = -1
+        now = time.monotonic()
+        if size != last_size:
+            last_size, stable_since = size, now
+        elif size > 0 and now - stable_since >= settle:
+            return True
+        time.sleep(interval)
+    return False
+
+
+def _dxfout(doc, dxf_fullpath):
+    """通过 DXFOUT 命令导出 DXF（旧版本 AutoCAD 不支持 SaveAs 时的后备方案）"""
+    logger = logging.getLogger(__name__)
+
+    # 使用 DXFOUT 命令导出 DXF
+    # 这会弹出保存对话框，但能保证正确转换
+    cmd = '_DXFOUT "' + dxf_fullpath + '" 16 \n'
+
+    # 发送命令，增加重试机制
+    retry_count = 3
+    for attempt in range(retry_count):
+        try:
+            doc.SendCommand(cmd)
+            break
+        except Exception as send_error:
+            if attempt < retry_count - 1:
+                logger.warning(
+                    "发送命令失败 (尝试 %d/%d): %s",
+                    attempt + 1,
+                    retry_count,
+                    str(send_error),
+                )
+                time.sleep(1)
+            else:
+                raise
+
+    # SendCommand 是异步的，轮询等待 DXF 写入完成
+    if not _wait_for_stable(Path(dxf_fullpath)):
+        raise TimeoutError(f"等待 DXF 输出超时: {dxf_fullpath}")
+
+
+def _convert_one(acad, dwg_file, dxf_path):
+    """
+    使用给定的 AutoCAD 实例转换单个 DWG 文件，失败时抛出异常
+
+    Args:
+        acad: AutoCAD 应用对象
+        dwg_file: DWG 文件路径 (Path)
+        dxf_path: 输出目录 (Path)
+    """
+    logger = logging.getLogger(__name__)
+
+    # 构建输出文件路径（不包含扩展名，让 AutoCAD 自动添加）
+    dxf_file = dxf_path / (dwg_file.stem + ".dxf")
+
+    # 打开 DWG 文件
+    # 使用绝对路径，并设置为只读模式
+    dwg_fullpath = str(dwg_file.absolute())
+
+    doc = None
+    try:
+        # Open 参数: (FileName, [ReadOnly])
+        # ReadOnly = True 以只读模式打开
+        # Documents.Open 返回时文档已加载完成，无需额外等待
+        doc = acad.Documents.Open(dwg_fullpath, True)
+
+        # 保存为 DXF
+        dxf_fullpath = str(dxf_file.absolute())
+
+        # 删除已存在的文件（如果有）
+        if dxf_file.exists():
+            dxf_file.unlink()
+
+        # 优先使用同步的 SaveAs 接口导出，调用返回即写入完成
+        try:
+            doc.SaveAs(dxf_fullpath, AC_2013_DXF)
+        except Exception as save_error:
+            logger.warning("SaveAs 导出失败，改用 DXFOUT 命令: %s", str(save_error))
+            _dxfout(doc, dxf_fullpath)
+    finally:
+        # 关闭文档（失败时也尝试关闭可能打开的文档）
+        if doc is not None:
+            try:
+                doc.Close(False)
+            except Exception:
+                pass
+
+
+def _init_worker(log_queue, log_level):
+    """工作进程初始化：日志转发到主进程，初始化 COM 并启动独立的 AutoCAD 实例"""
+    global _worker_acad
+
+    import pythoncom
+    from multiprocessing.util import Finalize
+
+    init_worker_logging(log_queue, log_level)
+    pythoncom.CoInitialize()
+    _worker_acad, _ = _connect_autocad(new_instance=True)
+    if _worker_acad is not None:
+        # 工作进程退出时关闭自己启动的 AutoCAD
+        Finalize(None, _worker_acad.Quit, exitpriority=10)
+
+
+def _convert_in_worker(dwg_file, dxf_dir):
+    """
+    在工作进程中转换单个文件
+
+    Returns:
+        失败时返回错误信息，成功返回 None（日志由主进程统一输出）
+    """
+    if _worker_acad is None:
+        return "工作进程无法连接到 AutoCAD"
+    try:
+        _convert_one(_worker_acad, Path(dwg_file), Path(dxf_dir))
+        return None
+    except Exception as e:
+        return str(e)
+
+
+def convert_dwg_to_dxf(dwg_dir="dwg", dxf_dir="dxf", workers=1):
     """
     将 DWG 文件批量转换为 DXF 格式
 
     Args:
         dwg_dir: 包含 DWG 文件的源目录
         dxf_dir: 保存 DXF 文件的目标目录
+        workers: 并行的 AutoCAD 实例数，1 表示在单个实例中串行转换
 
     Returns:
         转换成功的文件数量
@@ -46,117 +220,63 @@ def convert_dwg_to_dxf(dwg_dir="dwg", dxf_dir="dxf"):
 
     # 导入 AutoCAD 相关模块
     try:
-        import win32com.client
+        import win32com.client  # noqa: F401
     except ImportError:
         logger.error("未安装 pywin32，请运行: pip install pywin32")
         return 0
 
-    # 连接 AutoCAD
-    acad = None
-    # 尝试多个可能的 AutoCAD 版本
-    autocad_versions = [
-        "AutoCAD.Application.24",  # AutoCAD 2024
-        "AutoCAD.Application.23",  # AutoCAD 2023
-        "AutoCAD.Application.22",  # AutoCAD 2022
-        "AutoCAD.Application",  # 通用版本
-    ]
-
-    for version in autocad_versions:
-        try:
-            acad = win32com.client.Dispatch(version)
-            acad.Visible = False  # 后台运行
-            logger.info("成功连接到 AutoCAD (使用: %s)", version)
-            break
-        except Exception:
-            continue
-
-    if acad is None:
-        logger.error("无法连接到 AutoCAD")
-        logger.error("请确保 AutoCAD 已安装并正确注册")
-        logger.error("尝试过的版本: %s", ", ".join(autocad_versions))
-        logger.error("")
-        logger.error("*** 重要提示 ***")
-        logger.error("如果 AutoCAD 已安装但仍然连接失败，请尝试：")
-        logger.error("1. 以管理员身份运行 VS Code 或命令提示符")
-        logger.error("2. 或者以管理员身份运行此脚本")
-        logger.error("   右键点击 PowerShell/CMD -> '以管理员身份运行'")
-        logger.error("   然后执行: python convert_dwg_to_dxf.py")
-        return 0
-
     success_count = 0
     failed_files = []
-
-    # 转换每个文件
-    for dwg_file in dwg_files:
-        try:
-            # 构建输出文件路径（不包含扩展名，让 AutoCAD 自动添加）
-            dxf_file_stem = dwg_file.stem
-            dxf_file = dxf_path / (dxf_file_stem + ".dxf")
-
-            logger.info("转换: %s -> %s", dwg_file.name, dxf_file.name)
-
-            # 打开 DWG 文件
-            # 使用绝对路径，并设置为只读模式
-            dwg_fullpath = str(dwg_file.absolute())
-
-            # Open 参数: (FileName, [ReadOnly])
-            # ReadOnly = True 以只读模式打开
-            doc = acad.Documents.Open(dwg_fullpath, True)
-
-            # 等待文档完全加载
-            import time
-
-            time.sleep(1)
-
-            # 保存为 DXF
-            dxf_fullpath = str(dxf_file.absolute())
-
-            # 删除已存在的文件（如果有）
-            if dxf_file.exists():
-                dxf_file.unlink()
-
-            # 使用 DXFOUT 命令导出 DXF
-            # 这会弹出保存对话框，但能保证正确转换
-            cmd = '_DXFOUT "' + dxf_fullpath + '" 16 \n'
-
-            # 发送命令，增加重试机制
-            retry_count = 3
-            for attempt in range(retry_count):
-                try:
-                    doc.SendCommand(cmd)
-                    break
-                except Exception as send_error:
-                    if attempt < retry_count - 1:
-                        logger.warning(
-                            "发送命令失败 (尝试 %d/%d): %s",
-                            attempt + 1,
-                            retry_count,
-                            str(send_error),
-                        )
-                        time.sleep(1)
-                    else:
-                        raise
-
-            # 等待命令完成（增加等待时间）
-            time.sleep(3)
-
-            # 关闭文档
-            doc.Close(False)
-
-            logger.info("[SUCCESS] 转换成功: %s", dwg_file.name)
-            success_count += 1
-
-        except Exception as e:
-            logger.error("[FAILED] 转换失败 %s: %s", dwg_file.name, str(e))
-            failed_files.append(dwg_file.name)
-
-            # 尝试关闭可能打开的文档
+    workers = max(1, min(workers or 1, len(dwg_files)))
+
+    if workers > 1:
+        # 每个工作进程启动自己的 AutoCAD 实例，文件之间互不等待
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+
+        logger.info("使用 %d 个 AutoCAD 实例并行转换", workers)
+        convert = partial(_convert_in_worker, dxf_dir=str(dxf_path))
+        # 工作进程中的日志（如 SaveAs 失败改用 DXFOUT 的警告）经队列写入主进程日志
+        with forward_worker_logs() as log_args, ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=log_args
+        ) as executor:
+            results = executor.map(convert, [str(f) for f in dwg_files])
+            for dwg_file, error in zip(dwg_files, results):
+                if error is None:
+                    logger.info("[SUCCESS] 转换成功: %s", dwg_file.name)
+                    success_count += 1
+                else:
+                    logger.error("[FAILED] 转换失败 %s: %s", dwg_file.name, error)
+                    failed_files.append(dwg_file.name)
+    else:
+        # 连接 AutoCAD
+        acad, version = _connect_autocad()
+
+        if acad is None:
+            logger.error("无法连接到 AutoCAD")
+            logger.error("请确保 AutoCAD 已安装并正确注册")
+            logger.error("尝试过的版本: %s", ", ".join(AUTOCAD_VERSIONS))
+            logger.error("")
+            logger.error("*** 重要提示 ***")
+            logger.error("如果 AutoCAD 已安装但仍然连接失败，请尝试：")
+            logger.error("1. 以管理员身份运行 VS Code 或命令提示符")
+            logger.error("2. 或者以管理员身份运行此脚本")
+            logger.error("   右键点击 PowerShell/CMD -> '以管理员身份运行'")
+            logger.error("   然后执行: python convert_dwg_to_dxf.py")
+            return 0
+
+        logger.info("成功连接到 AutoCAD (使用: %s)", version)
+
+        # 转换每个文件
+        for dwg_file in dwg_files:
+            logger.info("转换: %s -> %s", dwg_file.name, dwg_file.stem + ".dxf")
             try:
-                if "doc" in locals() and doc is not None:
-                    doc.Close(False)
-            except Exception:
-                pass
-            continue
+                _convert_one(acad, dwg_file, dxf_path)
+                logger.info("[SUCCESS] 转换成功: %s", dwg_file.name)
+                success_count += 1
+            except Exception as e:
+                logger.error("[FAILED] 转换失败 %s: %s", dwg_file.name, str(e))
+                failed_files.append(dwg_file.name)
 
     # 输出总结
     print("\n" + "=" * 70)
@@ -188,13 +308,15 @@ def main():
     # 获取命令行参数
     dwg_dir = sys.argv[1] if len(sys.argv) > 1 else "dwg"
     dxf_dir = sys.argv[2] if len(sys.argv) > 2 else "dxf"
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 1
 
     print(f"\n源目录: {dwg_dir}")
     print(f"目标目录: {dxf_dir}")
+    print(f"并行实例: {workers}")
     print("-" * 70)
 
     # 执行转换
-    count = convert_dwg_to_dxf(dwg_dir, dxf_dir)
+    count = convert_dwg_to_dxf(dwg_dir, dxf_dir, workers)
 
     if count > 0:
         print(f"\n[SUCCESS] 成功转换 {count} 个文件")
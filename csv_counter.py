@@ -1,7 +1,10 @@
+import copy
 import csv
 import logging
 import os
 import glob
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from typing import Any, Dict, Optional, Tuple
 
 try:
@@ -13,18 +16,30 @@ except ImportError as exc:  # pragma: no cover
 
 from logging_config import setup_logger
 
+# 优先使用 libyaml 的 C 实现加载器，未编译 libyaml 时回退到纯 Python 版本
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(BASE_DIR, "config.yaml")
 PRIVATE_CONFIG_PATH = os.path.join(BASE_DIR, "private.yaml")
 
 
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime: float) -> Dict[str, Any]:
+    # mtime 参与缓存键，文件修改后会重新解析
+    with open(path, "rb", buffering=1 << 16) as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
 def _load_yaml(path: str, *, required: bool = False) -> Dict[str, Any]:
-    if not os.path.exists(path):
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
         if required:
             raise FileNotFoundError(f"配置文件不存在: {path}")
         return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    # _deep_update 会原地修改结果，返回副本以免污染缓存
+    return copy.deepcopy(_load_yaml_cached(path, mtime))
 
 
 def _deep_update(target: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
@@ -46,6 +61,7 @@ def load_config(
     return base_cfg
 
 
+@lru_cache(maxsize=64)
 def resolve_path(path_value: Optional[str]) -> Optional[str]:
     if not path_value:
         return None
@@ -60,6 +76,37 @@ def parse_log_level(level_name: Optional[str], default: int = logging.INFO) -> i
     return getattr(logging, str(level_name).upper(), default)
 
 
+def _count_file(
+    csv_path: str, column: str, value: str, delimiter: str, encoding: str
+) -> Tuple[str, int, int]:
+    """统计单个 CSV 文件，返回 (状态, 行数, 匹配行数)。
+
+    该函数会在子进程中执行，因此不直接写日志，而是把状态交给主进程记录。
+    状态取值: "ok" / "missing_column" / "not_found" / 其它为错误信息。
+    """
+    rows = 0
+    matched = 0
+    try:
+        with open(csv_path, "r", newline="", encoding=encoding) as f:
+            # 只需比较一列，直接按列下标读取，避免 DictReader 每行构造字典
+            reader = csv.reader(f, delimiter=delimiter)
+            header = next(reader, None)
+            if not header or column not in header:
+                return "missing_column", 0, 0
+            col_idx = header.index(column)
+            for row in reader:
+                if not row:
+                    continue
+                rows += 1
+                if col_idx < len(row) and row[col_idx] == value:
+                    matched += 1
+    except FileNotFoundError:
+        return "not_found", 0, 0
+    except Exception as e:
+        return f"{type(e).__name__}: {e}", 0, 0
+    return "ok", rows, matched
+
+
 def scan_csv_folder(
     folder: str,
     column: str,
@@ -69,6 +116,7 @@ def scan_csv_folder(
     encoding: str,
     recursive: bool,
     logger: logging.Logger,
+    workers: Optional[int] = 1,
 ) -> Tuple[int, int, int]:
     pattern = "**/*.csv" if recursive else "*.csv"
     csv_files = glob.glob(os.path.join(folder, pattern), recursive=recursive)
@@ -80,22 +128,31 @@ def scan_csv_folder(
     matched_rows = 0
     processed_files = 0
 
-    for csv_path in csv_files:
-        try:
-            with open(csv_path, "r", newline="", encoding=encoding) as f:
-                reader = csv.DictReader(f, delimiter=delimiter)
-                if not reader.fieldnames or column not in reader.fieldnames:
-                    logger.warning("文件缺少目标列，已跳过: %s", csv_path)
-                    continue
-                processed_files += 1
-                for row in reader:
-                    total_rows += 1
-                    if str(row.get(column, "")) == value:
-                        matched_rows += 1
-        except FileNotFoundError:
+    count = partial(
+        _count_file, column=column, value=value, delimiter=delimiter, encoding=encoding
+    )
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(csv_files))
+
+    if workers > 1:
+        # 各文件相互独立且解析为 CPU 密集，按文件分发到多个进程
+        chunksize = max(1, len(csv_files) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(count, csv_files, chunksize=chunksize))
+    else:
+        results = [count(csv_path) for csv_path in csv_files]
+
+    for csv_path, (status, rows, matched) in zip(csv_files, results):
+        if status == "ok":
+            processed_files += 1
+            total_rows += rows
+            matched_rows += matched
+        elif status == "missing_column":
+            logger.warning("文件缺少目标列，已跳过: %s", csv_path)
+        elif status == "not_found":
             logger.warning("文件不存在，已跳过: %s", csv_path)
-        except Exception:
-            logger.exception("读取 CSV 失败: %s", csv_path)
+        else:
+            logger.error("读取 CSV 失败: %s, 错误: %s", csv_path, status)
 
     return processed_files, total_rows, matched_rows
 
@@ -130,6 +187,8 @@ def main() -> None:
     delimiter = counter_cfg.get("delimiter", ",")
     encoding = counter_cfg.get("encoding", "utf-8")
     recursive = bool(counter_cfg.get("recursive", False))
+    workers = counter_cfg.get("workers")
+    workers = int(workers) if workers else None
 
     logger.info("读取配置: column=%s, value=%s", column, value)
     logger.info(
@@ -148,6 +207,7 @@ def main() -> None:
         encoding=encoding,
         recursive=recursive,
         logger=logger,
+        workers=workers,
     )
 
     logger.info("统计完成: 文件数=%d, 行数=%d, 匹配行数=%d", files, rows, matched)
@@ -4,56 +4,68 @@ AutoCAD COM 诊断工具
 检查系统上 AutoCAD 的 COM 注册情况
 """
 
+import argparse
+import importlib.util
 import sys
 
+# 诊断时检查的 AutoCAD ProgID
+_PROGIDS = (
+    "AutoCAD.Application",
+    "AutoCAD.Application.24",  # AutoCAD 2020
+    "AutoCAD.Application.23",  # AutoCAD 2019
+    "AutoCAD.Application.22",  # AutoCAD 2018
+    "AutoCAD.Application.21",  # AutoCAD 2017
+    "AutoCAD.Application.20",  # AutoCAD 2016
+    "AutoCAD.Application.19",  # AutoCAD 2015
+    "AutoCAD.Application.18",  # AutoCAD 2014
+)
 
-def diagnose_autocad_com():
-    """诊断 AutoCAD COM 接口"""
+
+def _lookup_progid_clsid(progid):
+    """
+    从 HKEY_CLASSES_ROOT 读取 ProgID 对应的 CLSID
+
+    Returns:
+        已注册时返回 CLSID 字符串，否则返回 None
+    """
+    import winreg
+
+    try:
+        with winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, progid + r"\CLSID") as key:
+            return winreg.QueryValue(key, None)
+    except OSError:
+        return None
+
+
+def diagnose_autocad_com(launch: bool = True):
+    """诊断 AutoCAD COM 接口
+
+    Args:
+        launch: 为 False 时跳过第 4 步（启动新 AutoCAD 实例），只检查注册情况
+    """
     print("=" * 70)
     print("AutoCAD COM 接口诊断")
     print("=" * 70)
 
-    # 1. 检查 win32com 是否可用
+    # 1. 检查 win32com 是否可用（只查找模块，不执行导入；COM 检查时才真正加载）
     print("\n1. 检查 win32com 模块...")
-    try:
-        import win32com.client
-
-        print("   ✓ win32com.client 可用")
-    except ImportError as e:
-        print(f"   ✗ win32com.client 不可用: {e}")
+    if importlib.util.find_spec("win32com") is None:
+        print("   ✗ win32com.client 不可用: 未安装 pywin32")
         print("\n   请运行: pip install pywin32")
         return False
+    print("   ✓ 已找到 pywin32 (win32com)，第 3 步加载时确认能否导入")
 
     # 2. 尝试列出可能的 AutoCAD ProgID
     print("\n2. 搜索 AutoCAD ProgID...")
-    possible_progids = [
-        "AutoCAD.Application",
-        "AutoCAD.Application.24",  # AutoCAD 2020
-        "AutoCAD.Application.23",  # AutoCAD 2019
-        "AutoCAD.Application.22",  # AutoCAD 2018
-        "AutoCAD.Application.21",  # AutoCAD 2017
-        "AutoCAD.Application.20",  # AutoCAD 2016
-        "AutoCAD.Application.19",  # AutoCAD 2015
-        "AutoCAD.Application.18",  # AutoCAD 2014
-    ]
-
+    # 通过注册表判断 ProgID 是否已注册，避免 Dispatch 为每个候选项启动一次 AutoCAD
     found_progids = []
-    for progid in possible_progids:
-        try:
-            obj = win32com.client.Dispatch(progid)
+    for progid in _PROGIDS:
+        clsid = _lookup_progid_clsid(progid)
+        if clsid:
             print(f"   ✓ 找到: {progid}")
-            try:
-                version = obj.Version
-                print(f"     版本: {version}")
-            except Exception:
-                pass
+            print(f"     CLSID: {clsid}")
             found_progids.append(progid)
-            # 关闭
-            try:
-                obj.Quit()
-            except Exception:
-                pass
-        except Exception:
+        else:
             print(f"   ✗ {progid}: 不可用")
 
     if not found_progids:
@@ -70,6 +82,15 @@ def diagnose_autocad_com():
 
     # 3. 尝试连接到运行中的实例
     print("\n3. 检查运行中的 AutoCAD 实例...")
+    try:
+        import win32com.client
+        from pywintypes import com_error
+    except ImportError as e:
+        # pywin32 安装不完整时模块可以找到，但导入失败（如 DLL load failed）
+        print(f"   ✗ win32com.client 不可用: {e}")
+        print("\n   请运行: pip install pywin32")
+        return False
+
     for progid in found_progids:
         try:
             acad = win32com.client.GetActiveObject(progid)
@@ -79,10 +100,14 @@ def diagnose_autocad_com():
             except Exception:
                 pass
             break
-        except Exception:
+        except com_error:
             print(f"   - {progid}: 未运行")
 
     # 4. 测试创建新实例
+    if not launch:
+        print("\n4. 跳过启动新 AutoCAD 实例 (--quick)")
+        return True
+
     print("\n4. 测试启动新 AutoCAD 实例...")
     print("   (这可能需要几秒钟...)")
     try:
@@ -146,9 +171,17 @@ def check_registry():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="诊断 AutoCAD COM 接口配置")
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="只检查注册与运行中的实例，不启动新的 AutoCAD",
+    )
+    args = parser.parse_args()
+
     print("\n此工具将诊断系统上的 AutoCAD COM 接口配置\n")
 
-    success = diagnose_autocad_com()
+    success = diagnose_autocad_com(launch=not args.quick)
 
     # 额外检查注册表
     try:
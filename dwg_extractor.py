@@ -2,26 +2,73 @@
 DWG 元素提取模块。
 
 从 DWG 文件中提取文本、线条、矩形等元素及其详细特征。
-使用 pyautocad 通过 AutoCAD COM 接口提取数据。
+默认使用 pyautocad 通过 AutoCAD COM 接口提取数据；也可选择 ezdxf 后端，
+借助 ODA File Converter 读取 DWG，无需安装 AutoCAD。
 """
 
+import importlib.util
 import logging
 import os
+import sys
 import time
-from typing import List, Dict, Any
-from dataclasses import dataclass, asdict
+from itertools import repeat
+from typing import List, Dict, Any, Iterable, Optional, TextIO, Tuple, Union
+from dataclasses import dataclass, fields
 
-try:
-    import win32com.client
+# 仅检查 pywin32 是否安装，不在导入时加载（加载 pywin32 及 gen_py 缓存较慢）
+PYAUTOCAD_AVAILABLE = importlib.util.find_spec("win32com") is not None
+_win32com_client = None
 
-    PYAUTOCAD_AVAILABLE = True
-except ImportError:
-    win32com = None
-    PYAUTOCAD_AVAILABLE = False
 
+def _get_win32com():
+    """按需导入并返回 win32com.client 模块"""
+    global _win32com_client
+    if _win32com_client is None:
+        import win32com.client
 
-@dataclass
-class TextElement:
+        _win32com_client = win32com.client
+    return _win32com_client
+
+
+# 依次探测的 AutoCAD ProgID：不带版本号的 ProgID 指向当前安装版本，其余为回退
+_PROGIDS = (
+    "AutoCAD.Application",
+    "AutoCAD.Application.24",  # AutoCAD 2020
+    "AutoCAD.Application.23",  # AutoCAD 2019
+    "AutoCAD.Application.22",  # AutoCAD 2018
+    "AutoCAD.Application.21",  # AutoCAD 2017
+    "AutoCAD.Application.20",  # AutoCAD 2016
+)
+
+
+def _registered_progid() -> Optional[str]:
+    """从注册表读取 AutoCAD.Application 的当前版本 ProgID（CurVer），读取失败返回 None"""
+    try:
+        import winreg
+
+        with winreg.OpenKey(
+            winreg.HKEY_CLASSES_ROOT, r"AutoCAD.Application\CurVer"
+        ) as key:
+            return winreg.QueryValue(key, None) or None
+    except (ImportError, OSError):
+        return None
+
+
+class _Record:
+    """元素记录基类：提供比 dataclasses.asdict 更轻量的字典转换
+
+    子类使用 @dataclass(slots=True)，基类也声明空 __slots__，实例不再分配 __dict__。
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        # 字段均为标量，无需 asdict 的递归深拷贝
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+@dataclass(slots=True)
+class TextElement(_Record):
     """文本元素数据类"""
 
     type: str = "TEXT"
@@ -36,8 +83,8 @@ class TextElement:
     style: str = ""
 
 
-@dataclass
-class LineElement:
+@dataclass(slots=True)
+class LineElement(_Record):
     """线条元素数据类"""
 
     type: str = "LINE"
@@ -53,8 +100,8 @@ class LineElement:
     lineweight: int = -1
 
 
-@dataclass
-class RectElement:
+@dataclass(slots=True)
+class RectElement(_Record):
     """矩形元素数据类"""
 
     type: str = "RECT"
@@ -68,8 +115,8 @@ class RectElement:
     is_closed: bool = True
 
 
-@dataclass
-class CircleElement:
+@dataclass(slots=True)
+class CircleElement(_Record):
     """圆形元素数据类"""
 
     type: str = "CIRCLE"
@@ -81,19 +128,132 @@ class CircleElement:
     layer: str = ""
 
 
+def _extract_one(
+    dwg_path: str, extract_config: Optional[Dict[str, bool]], backend: str
+) -> Tuple[Optional[Dict[str, List]], Optional[str]]:
+    """
+    在工作进程中提取单个文件。
+
+    :return: (元素字典, None)；失败时返回 (None, 错误信息)，由主进程统一记录日志
+    """
+    try:
+        with DWGExtractor(backend=backend) as extractor:
+            return extractor.extract_from_file(dwg_path, extract_config), None
+    except Exception as e:
+        return None, str(e)
+
+
+# COM 错误码：被调用方忙而拒绝调用（AutoCAD 正在处理其他命令）
+RPC_E_CALL_REJECTED = -2147418111
+_COM_BUSY_RETRIES = 3
+
+# IDispatch::Invoke 的 wFlags：读取属性
+_DISPATCH_PROPERTYGET = 2
+
+# 选择集：acSelectionSetAll 选择全部实体，由 DXF 组码过滤
+_AC_SELECTION_SET_ALL = 5
+_SELECTION_SET_NAME = "GetDwgInfo_extract"
+# 组码 0 = 实体 DXF 类型，组码 410 = 所在布局
+_FILTER_ENTITY_TYPE = 0
+_FILTER_LAYOUT = 410
+
+# COM ObjectName -> DXF 实体类型名（选择集过滤条件）
+_DXF_TYPE_NAMES = {
+    "AcDbText": "TEXT",
+    "AcDbMText": "MTEXT",
+    "AcDbLine": "LINE",
+    "AcDbPolyline": "LWPOLYLINE",
+    "AcDbLwPolyline": "LWPOLYLINE",
+    "AcDb2dPolyline": "POLYLINE",
+    "AcDbCircle": "CIRCLE",
+}
+
+# 各类实体需要读取的 COM 属性（按提取方法中的解包顺序）
+_TEXT_PROPERTIES = (
+    "TextString",
+    "InsertionPoint",
+    "Height",
+    "Rotation",
+    "Color",
+    "Layer",
+    "StyleName",
+)
+_LINE_PROPERTIES = ("StartPoint", "EndPoint", "Lineweight")
+_CIRCLE_PROPERTIES = ("Center", "Radius", "Color", "Layer")
+
+# CSV 输出列：各元素记录字段的并集，结构在导入时即已确定
+_CSV_FIELDNAMES = sorted(
+    {
+        f.name
+        for cls in (TextElement, LineElement, RectElement, CircleElement)
+        for f in fields(cls)
+    }
+)
+
+# 元素容器的类别
+ELEMENT_KEYS = ("texts", "lines", "rects", "circles", "polylines")
+
+# 写入 CSV 的元素类别（与 get_all_elements 一致，不含多段线）
+_CSV_BUCKETS = ("texts", "lines", "rects", "circles")
+
+
 class DWGExtractor:
     """DWG 元素提取器类"""
 
-    def __init__(self):
-        """初始化提取器"""
+    BACKENDS = ("com", "ezdxf")
+
+    # 首次成功连接的 AutoCAD ProgID，在所有实例间共享，后续连接优先使用
+    _PROGID_CACHE: Optional[str] = None
+
+    # 提取配置的默认值
+    DEFAULT_EXTRACT_CONFIG = {
+        "extract_text": True,
+        "extract_lines": True,
+        "extract_rects": True,
+        "extract_circles": True,
+        "extract_polylines": True,
+    }
+
+    # 实体类型 -> (启用该类型的提取配置项，任一为真即处理, 提取方法名)
+    _POLYLINE_KEYS = ("extract_rects", "extract_polylines")
+    _HANDLERS = {
+        "AcDbText": (("extract_text",), "_extract_text"),
+        "AcDbMText": (("extract_text",), "_extract_text"),
+        "AcDbLine": (("extract_lines",), "_extract_line"),
+        "AcDbPolyline": (_POLYLINE_KEYS, "_extract_polyline"),
+        "AcDb2dPolyline": (_POLYLINE_KEYS, "_extract_polyline"),
+        "AcDbLwPolyline": (_POLYLINE_KEYS, "_extract_polyline"),
+        "AcDbCircle": (("extract_circles",), "_extract_circle"),
+    }
+
+    def __init__(self, backend: str = "com", acad_app=None):
+        """
+        初始化提取器
+
+        :param backend: 提取后端，"com" 通过 AutoCAD COM 接口读取；
+            "ezdxf" 通过 ezdxf 的 odafc 插件读取（需安装 ODA File Converter），
+            不可用时回退到 COM
+        :param acad_app: 可选，调用方已连接的 AutoCAD 应用对象；传入时直接复用，
+            不再重新连接，close() 也不会退出它
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"未知的提取后端: {backend}，可选: {self.BACKENDS}")
         self.logger = logging.getLogger(__name__)
-        self.elements = {
-            "texts": [],
-            "lines": [],
-            "rects": [],
-            "circles": [],
-            "polylines": [],
-        }
+        self.backend = backend
+        self._acad_app = acad_app
+        self._owns_acad_app = False
+        # ObjectDBX 文档的 ProgID，随 AutoCAD 版本而定，首次使用时确定
+        self._dbx_progid: Optional[str] = None
+        self._want_rects = True
+        self._want_polylines = False
+        # (实体类型, 属性名) -> DISPID，实体不支持该属性时为 None
+        self._dispids: Dict[Tuple[str, str], Optional[int]] = {}
+        self.elements: Dict[str, List] = {key: [] for key in ELEMENT_KEYS}
+
+    def _reset_elements(self) -> None:
+        """清空元素容器：原地清空各列表，批量处理时不反复分配，列表对象保持不变"""
+        for bucket in self.elements.values():
+            bucket.clear()
 
     def extract_from_file(
         self, dwg_path: str, extract_config: Dict[str, bool]
@@ -103,19 +263,31 @@ class DWGExtractor:
 
         :param dwg_path: DWG 文件路径
         :param extract_config: 提取配置字典，指定要提取的元素类型
-        :return: 包含各类元素的字典
+        :return: 包含各类元素的字典。该字典即 self.elements，字典及其中的列表
+            在下一次提取时会被原地清空并重新填充；需要保留结果时请先复制，
+            如 {k: list(v) for k, v in elements.items()}
         """
-        if extract_config is None:
-            extract_config = {
-                "extract_text": True,
-                "extract_lines": True,
-                "extract_rects": True,
-                "extract_circles": True,
-            }
+        user_config = extract_config or {}
+        extract_config = {**self.DEFAULT_EXTRACT_CONFIG, **user_config}
+        # 未指定 extract_polylines 时跟随 extract_rects：识别矩形时记录全部多段线
+        if "extract_polylines" not in user_config:
+            extract_config["extract_polylines"] = extract_config["extract_rects"]
+
+        if self.backend == "ezdxf":
+            try:
+                return self._extract_with_ezdxf(dwg_path, extract_config)
+            except (ImportError, RuntimeError) as e:
+                # ezdxf 或 ODA File Converter 不可用，回退到 COM
+                self.logger.warning("ezdxf 后端不可用，回退到 AutoCAD COM: %s", str(e))
+
+        # 重置元素列表
+        self._reset_elements()
 
         acad_app = None
         doc = None
+        in_editor = False
         original_doc = None
+        selection = None
 
         try:
             self.logger.info("开始提取 DWG 文件: %s", dwg_path)
@@ -126,83 +298,33 @@ class DWGExtractor:
 
             # 获取绝对路径
             dwg_path = os.path.abspath(dwg_path)
-            # 连接到 AutoCAD - 使用 win32com 直接连接
-            if not PYAUTOCAD_AVAILABLE or win32com is None:
-                raise RuntimeError(
-                    "无法连接到 AutoCAD：未安装 pywin32 (win32com) 模块，请先安装。"
-                )
-            try:
-                # 尝试获取已运行的 AutoCAD 实例
-                # 尝试获取已运行的 AutoCAD 实例
-                acad_app = None
-                progids = [
-                    "AutoCAD.Application",
-                    "AutoCAD.Application.24",  # AutoCAD 2020
-                    "AutoCAD.Application.23",  # AutoCAD 2019
-                    "AutoCAD.Application.22",  # AutoCAD 2018
-                    "AutoCAD.Application.21",  # AutoCAD 2017
-                    "AutoCAD.Application.20",  # AutoCAD 2016
-                ]
-
-                # 首先尝试连接到已运行的实例
-                for progid in progids:
-                    try:
-                        acad_app = win32com.client.GetActiveObject(progid)
-                        self.logger.info("连接到已运行的 AutoCAD: %s", progid)
-                        break
-                    except Exception:
-                        continue
+            # 连接到 AutoCAD（首次调用时连接，之后复用同一实例）
+            acad_app = self._ensure_acad_app()
 
-                # 如果没有运行实例，尝试启动新实例
-                if acad_app is None:
-                    for progid in progids:
-                        try:
-                            acad_app = win32com.client.Dispatch(progid)
-                            acad_app.Visible = True
-                            self.logger.info("启动新的 AutoCAD 实例: %s", progid)
-                            # 等待 AutoCAD 初始化
-                            time.sleep(2)
-                            break
-                        except Exception:
-                            continue
-
-                if acad_app is None:
-                    raise RuntimeError("无法找到或启动 AutoCAD")
-
-                self.logger.info("成功连接到 AutoCAD")
-            except Exception as e:
-                raise RuntimeError(
-                    f"无法连接到 AutoCAD，请确保 AutoCAD 已安装并可以启动。"
-                    f"错误: {str(e)}"
-                )
-            # 保存当前文档引用
-            try:
-                if acad_app.Documents.Count > 0:
-                    original_doc = acad_app.ActiveDocument
-            except Exception:
-                original_doc = None
+            # 优先通过 ObjectDBX 在后台读取，不在编辑器中打开文档
+            doc = self._open_dbx_document(acad_app, dwg_path)
+            in_editor = doc is None
 
-            # 打开 DWG 文件
-            try:
-                # 使用 Documents.Open 方法
-                # 参数: Name, [ReadOnly], [Password]
-                doc = acad_app.Documents.Open(dwg_path, True)  # True = 只读
-                # 设置为活动文档并获取引用
-                acad_app.ActiveDocument = doc
-                # 重新获取活动文档引用以确保正确
-                doc = acad_app.ActiveDocument
-                self.logger.info("成功打开文件: %s", dwg_path)
-            except Exception as e:
-                raise RuntimeError(f"无法打开 DWG 文件: {str(e)}")
-
-            # 重置元素列表
-            self.elements = {
-                "texts": [],
-                "lines": [],
-                "rects": [],
-                "circles": [],
-                "polylines": [],
-            }
+            if in_editor:
+                # 保存当前文档引用
+                try:
+                    if acad_app.Documents.Count > 0:
+                        original_doc = acad_app.ActiveDocument
+                except Exception:
+                    original_doc = None
+
+                # 打开 DWG 文件
+                try:
+                    # 使用 Documents.Open 方法
+                    # 参数: Name, [ReadOnly], [Password]
+                    doc = acad_app.Documents.Open(dwg_path, True)  # True = 只读
+                    # 设置为活动文档并获取引用
+                    acad_app.ActiveDocument = doc
+                    # 重新获取活动文档引用以确保正确
+                    doc = acad_app.ActiveDocument
+                    self.logger.info("成功打开文件: %s", dwg_path)
+                except Exception as e:
+                    raise RuntimeError(f"无法打开 DWG 文件: {str(e)}")
 
             # 获取模型空间
             modelspace = doc.ModelSpace
@@ -211,41 +333,47 @@ class DWGExtractor:
             entity_count = modelspace.Count
             self.logger.info("模型空间中共有 %d 个实体", entity_count)
 
+            # 按配置预先构建 ObjectName -> 提取方法 的分派表，循环内只需一次字典查找
+            handlers = {
+                object_name: getattr(self, method_name)
+                for object_name, (config_keys, method_name) in self._HANDLERS.items()
+                if any(extract_config[key] for key in config_keys)
+            }
+            self._want_rects = bool(extract_config["extract_rects"])
+            self._want_polylines = bool(extract_config["extract_polylines"])
+
+            # 编辑器中打开的文档可用选择集由 AutoCAD 端按类型过滤，
+            # 只取回需要的实体；ObjectDBX 文档不支持选择集，逐个遍历模型空间
+            if in_editor:
+                selection = self._select_entities(doc, handlers)
+            if selection is not None:
+                entities = selection
+                entity_count = selection.Count
+                self.logger.info("按类型过滤后需处理 %d 个实体", entity_count)
+            else:
+                entities = modelspace
+
+            # 循环内频繁使用的方法先绑定到局部变量，省去每次的属性查找
+            get_item = entities.Item
+            get_handler = handlers.get
+            get_dispid = self._get_dispid
+            invoke_get = self._invoke_get
+
             # 遍历所有实体 - 使用索引方式而不是迭代器
             for i in range(entity_count):
                 entity_type = "Unknown"  # 初始化默认值
                 try:
-                    entity = modelspace.Item(i)
-                    entity_type = entity.ObjectName
-
-                    # 提取文本元素
-                    if extract_config.get("extract_text", True) and entity_type in [
-                        "AcDbText",
-                        "AcDbMText",
-                    ]:
-                        self._extract_text(entity)
-
-                    # 提取线条元素
-                    elif (
-                        extract_config.get("extract_lines", True)
-                        and entity_type == "AcDbLine"
-                    ):
-                        self._extract_line(entity)
-
-                    # 提取多段线（可能是矩形）
-                    elif extract_config.get("extract_rects", True) and entity_type in [
-                        "AcDbPolyline",
-                        "AcDb2dPolyline",
-                        "AcDbLwPolyline",
-                    ]:
-                        self._extract_polyline(entity)
-
-                    # 提取圆形
-                    elif (
-                        extract_config.get("extract_circles", True)
-                        and entity_type == "AcDbCircle"
-                    ):
-                        self._extract_circle(entity)
+                    # 直接使用原始 IDispatch，按缓存的 DISPID 读取属性，
+                    # 省去每次属性访问的 GetIDsOfNames 名称解析
+                    entity = get_item(i)._oleobj_
+                    # ObjectName 定义在所有实体共同的基接口上，DISPID 对所有类型相同
+                    entity_type = invoke_get(
+                        entity, get_dispid(entity, "*", "ObjectName"), "Unknown"
+                    )
+
+                    handler = get_handler(entity_type)
+                    if handler is not None:
+                        handler(entity, entity_type)
 
                 except Exception as e:
                     self.logger.warning(
@@ -268,39 +396,385 @@ class DWGExtractor:
             raise
 
         finally:
-            # 关闭打开的文档
-            if doc is not None:
+            if selection is not None:
+                try:
+                    selection.Delete()
+                except Exception:
+                    pass
+
+            # 关闭在编辑器中打开的文档；ObjectDBX 文档释放引用即可
+            if doc is not None and in_editor:
                 try:
                     doc.Close(False)  # False = 不保存更改
                     self.logger.info("已关闭 DWG 文件")
                 except Exception as e:
                     self.logger.warning("关闭文档时出错: %s", str(e))
 
-            # 恢复原始文档
-            if (
-                "acad_app" in locals()
-                and acad_app is not None
-                and original_doc is not None
-            ):
+            # 恢复原始文档（AutoCAD 实例保持运行，由 close() 统一释放）
+            if acad_app is not None and original_doc is not None:
                 try:
                     acad_app.ActiveDocument = original_doc
                 except Exception:
                     pass
 
-    def _safe_get_attribute(self, entity, attr_name, default=None, max_retries=3):
-        """安全地获取COM对象属性，带重试机制"""
-        for attempt in range(max_retries):
+    def _select_entities(self, doc, object_names: Iterable[str]):
+        """
+        创建只包含模型空间中指定类型实体的选择集，过滤在 AutoCAD 端完成，
+        不需要的实体不会产生跨进程调用
+
+        :param object_names: 需要的 COM ObjectName
+        :return: 选择集；无法创建时返回 None，由调用方回退到遍历模型空间
+        """
+        dxf_names = sorted({_DXF_TYPE_NAMES[name] for name in object_names})
+        if not dxf_names:
+            return None
+        try:
+            import pythoncom
+
+            VARIANT = _get_win32com().VARIANT
+            filter_type = VARIANT(
+                pythoncom.VT_ARRAY | pythoncom.VT_I2,
+                (_FILTER_ENTITY_TYPE, _FILTER_LAYOUT),
+            )
+            filter_data = VARIANT(
+                pythoncom.VT_ARRAY | pythoncom.VT_VARIANT,
+                (",".join(dxf_names), "Model"),
+            )
+
+            selection_sets = doc.SelectionSets
+            # 同名选择集已存在（如上次异常退出遗留）时 Add 会失败，先删除
             try:
-                if hasattr(entity, attr_name):
-                    return getattr(entity, attr_name)
-                return default
+                selection_sets.Item(_SELECTION_SET_NAME).Delete()
+            except Exception:
+                pass
+            selection = selection_sets.Add(_SELECTION_SET_NAME)
+        except Exception as e:
+            self.logger.debug("无法创建选择集，改为遍历模型空间: %s", str(e))
+            return None
+
+        try:
+            selection.Select(
+                _AC_SELECTION_SET_ALL,
+                pythoncom.Empty,
+                pythoncom.Empty,
+                filter_type,
+                filter_data,
+            )
+        except Exception as e:
+            self.logger.debug("选择集过滤失败，改为遍历模型空间: %s", str(e))
+            try:
+                selection.Delete()
+            except Exception:
+                pass
+            return None
+        return selection
+
+    def _ensure_acad_app(self):
+        """
+        获取 AutoCAD 应用对象：首次调用时连接已运行的实例或启动新实例，
+        之后在提取器生命周期内复用，避免每个文件都重新连接/启动。
+        复用前先读取一次 Name 确认连接仍然有效；AutoCAD 已被关闭或崩溃时
+        丢弃失效的句柄并重新连接。
+        """
+        if self._acad_app is not None:
+            from pywintypes import com_error
+
+            try:
+                self._acad_app.Name
+                return self._acad_app
+            except com_error as e:
+                self.logger.warning("AutoCAD 连接已失效，重新连接: %s", str(e))
+                self._acad_app = None
+                self._owns_acad_app = False
+                self._dbx_progid = None
+
+        if not PYAUTOCAD_AVAILABLE:
+            raise RuntimeError(
+                "无法连接到 AutoCAD：未安装 pywin32 (win32com) 模块，请先安装。"
+            )
+        win32com_client = _get_win32com()
+        from pywintypes import com_error
+
+        try:
+            acad_app = None
+            progids: Tuple[str, ...] = _PROGIDS
+            # 上次成功连接的 ProgID 优先尝试；首次连接时先试注册表登记的当前版本，
+            # 避免逐个探测未安装的版本（每次失败都要付出一次 COM 异常的代价）
+            preferred = DWGExtractor._PROGID_CACHE or _registered_progid()
+            if preferred:
+                progids = (preferred,) + tuple(p for p in _PROGIDS if p != preferred)
+
+            # 首先尝试连接到已运行的实例
+            # 未运行/未注册时 COM 抛出 com_error，只捕获这一种，其他异常照常上抛
+            for progid in progids:
+                try:
+                    active = win32com_client.GetActiveObject(progid)
+                except com_error:
+                    continue
+                acad_app = self._early_bind(active)
+                DWGExtractor._PROGID_CACHE = progid
+                self.logger.info("连接到已运行的 AutoCAD: %s", progid)
+                break
+
+            # 如果没有运行实例，尝试启动新实例
+            if acad_app is None:
+                for progid in progids:
+                    try:
+                        acad_app = self._early_bind(progid)
+                        acad_app.Visible = True
+                        DWGExtractor._PROGID_CACHE = progid
+                        # 由本提取器启动的实例在 close() 时退出
+                        self._owns_acad_app = True
+                        self.logger.info("启动新的 AutoCAD 实例: %s", progid)
+                        # 等待 AutoCAD 初始化
+                        time.sleep(2)
+                        break
+                    except com_error:
+                        continue
+
+            if acad_app is None:
+                raise RuntimeError("无法找到或启动 AutoCAD")
+
+            self.logger.info("成功连接到 AutoCAD")
+        except Exception as e:
+            raise RuntimeError(
+                f"无法连接到 AutoCAD，请确保 AutoCAD 已安装并可以启动。"
+                f"错误: {str(e)}"
+            )
+
+        self._acad_app = acad_app
+        return acad_app
+
+    def _open_dbx_document(self, acad_app, dwg_path: str):
+        """
+        通过 ObjectDBX (AxDbDocument) 在后台读取 DWG。
+
+        只把图形数据库读入内存，不创建文档窗口、不重生成视图，
+        比 Documents.Open 快得多。ObjectDBX 不可用时返回 None。
+        """
+        try:
+            if self._dbx_progid is None:
+                # Version 形如 "24.1s (LMS Tech)"，ObjectDBX 的 ProgID 使用主版本号；
+                # Version 是跨进程的 COM 属性读取，每个 AutoCAD 实例只读一次
+                major = str(acad_app.Version).split(".")[0]
+                self._dbx_progid = f"ObjectDBX.AxDbDocument.{major}"
+            dbx = self._early_bind(acad_app.GetInterfaceObject(self._dbx_progid))
+            dbx.Open(dwg_path)
+            self.logger.info("通过 ObjectDBX 打开文件: %s", dwg_path)
+            return dbx
+        except Exception as e:
+            self.logger.debug("ObjectDBX 不可用，改用 Documents.Open: %s", str(e))
+            return None
+
+    def close(self) -> None:
+        """释放 AutoCAD 连接；若实例由本提取器启动则退出 AutoCAD"""
+        if self._acad_app is None:
+            return
+        if self._owns_acad_app:
+            try:
+                self._acad_app.Quit()
+                self.logger.info("已退出 AutoCAD")
+            except Exception as e:
+                self.logger.warning("退出 AutoCAD 时出错: %s", str(e))
+        self._acad_app = None
+        self._owns_acad_app = False
+        self._dbx_progid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _ezdxf_available() -> bool:
+        """ezdxf 及 ODA File Converter 是否可用"""
+        try:
+            from ezdxf.addons import odafc
+        except ImportError:
+            return False
+        return odafc.is_installed()
+
+    def extract_many(
+        self,
+        dwg_paths: Iterable[str],
+        extract_config: Optional[Dict[str, bool]] = None,
+        workers: Optional[int] = None,
+    ) -> Dict[str, Dict[str, List]]:
+        """
+        批量提取多个 DWG 文件。
+
+        ezdxf 后端不依赖 COM，按文件分发到多个进程并行提取；
+        COM 后端只有一个单线程套间的 AutoCAD 实例，按顺序提取。
+
+        :param dwg_paths: DWG 文件路径列表
+        :param extract_config: 提取配置字典
+        :param workers: 并行进程数，None 表示按 CPU 核数
+        :return: {文件路径: 元素字典}，提取失败的文件不包含在结果中
+        """
+        dwg_paths = list(dwg_paths)
+        results: Dict[str, Dict[str, List]] = {}
+
+        if self.backend == "ezdxf" and self._ezdxf_available():
+            from concurrent.futures import ProcessPoolExecutor
+
+            from logging_config import forward_worker_logs, init_worker_logging
+
+            # 工作进程的日志经队列发回本进程，由当前配置的处理器输出
+            with forward_worker_logs() as log_args, ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=init_worker_logging,
+                initargs=log_args,
+            ) as executor:
+                outcomes = executor.map(
+                    _extract_one, dwg_paths, repeat(extract_config), repeat(self.backend)
+                )
+                for dwg_path, (elements, error) in zip(dwg_paths, outcomes):
+                    if error is not None:
+                        self.logger.error("提取失败 %s: %s", dwg_path, error)
+                        continue
+                    results[dwg_path] = elements
+        else:
+            for dwg_path in dwg_paths:
+                try:
+                    elements = self.extract_from_file(dwg_path, extract_config)
+                except Exception as e:
+                    self.logger.error("提取失败 %s: %s", dwg_path, str(e))
+                    continue
+                # self.elements 会在下一次提取时重置，这里保存各列表的副本
+                results[dwg_path] = {k: list(v) for k, v in elements.items()}
+
+        self.logger.info("批量提取完成: 成功 %d/%d", len(results), len(dwg_paths))
+        return results
+
+    def _extract_with_ezdxf(
+        self, dwg_path: str, extract_config: Dict[str, bool]
+    ) -> Dict[str, List]:
+        """
+        使用 ezdxf 后端提取元素：经 ODA File Converter 读取 DWG，
+        复用 DXFExtractor 的提取逻辑，再转换为与 COM 后端一致的记录格式。
+
+        :raises ImportError: 未安装 ezdxf
+        :raises RuntimeError: 未安装 ODA File Converter
+        """
+        from ezdxf.addons import odafc
+
+        from dxf_extractor import DXFExtractor
+
+        if not os.path.exists(dwg_path):
+            raise FileNotFoundError(f"DWG 文件不存在: {dwg_path}")
+        if not odafc.is_installed():
+            raise RuntimeError("未找到 ODA File Converter")
+
+        dwg_path = os.path.abspath(dwg_path)
+        self.logger.info("开始提取 DWG 文件 (ezdxf): %s", dwg_path)
+
+        # 与 COM 后端一致：记录多段线时矩形也计入 polylines
+        dxf_extractor = DXFExtractor(
+            keep_rect_polylines=bool(extract_config["extract_polylines"])
+        )
+        dxf_extractor.doc = odafc.readfile(dwg_path)
+        dxf_extractor.msp = dxf_extractor.doc.modelspace()
+        # DXFExtractor 在 extract_rects 开启时同时识别矩形与普通多段线
+        dxf_config = dict(extract_config)
+        dxf_config["extract_rects"] = (
+            extract_config["extract_rects"] or extract_config["extract_polylines"]
+        )
+        extracted = dxf_extractor.extract(dxf_config)
+
+        # DXF 记录的 type 为小写类别名，转换时改用 COM 后端的 ObjectName 风格
+        self._reset_elements()
+        elements = self.elements
+        elements["texts"].extend(
+            TextElement(**{**e, "type": "TEXT"}).to_dict() for e in extracted["texts"]
+        )
+        elements["lines"].extend(
+            LineElement(**{**e, "type": "LINE"}).to_dict() for e in extracted["lines"]
+        )
+        if extract_config["extract_rects"]:
+            elements["rects"].extend(
+                RectElement(**{**e, "type": "RECT"}).to_dict()
+                for e in extracted["rects"]
+            )
+        elements["circles"].extend(
+            CircleElement(**{**e, "type": "CIRCLE"}).to_dict()
+            for e in extracted["circles"]
+        )
+        if extract_config["extract_polylines"]:
+            elements["polylines"].extend(
+                {**e, "type": "POLYLINE"} for e in extracted["polylines"]
+            )
+        return elements
+
+    @staticmethod
+    def _early_bind(obj):
+        """
+        获取早绑定（gencache 生成的类型化）COM 代理。
+
+        早绑定代理按已知 DISPID 直接 Invoke，省去每次属性访问的
+        GetIDsOfNames 查询；生成失败时回退到动态 Dispatch。
+
+        :param obj: ProgID 字符串或已有的 COM 对象
+        """
+        win32com_client = _get_win32com()
+        try:
+            return win32com_client.gencache.EnsureDispatch(obj)
+        except Exception:
+            return win32com_client.Dispatch(obj)
+
+    def _get_dispid(self, oleobj, entity_type: str, name: str) -> Optional[int]:
+        """
+        获取属性的 DISPID，按 (实体类型, 属性名) 缓存。
+
+        每种实体类型的每个属性只调用一次 GetIDsOfNames，之后直接按 DISPID Invoke。
+        实体不支持该属性时缓存为 None。
+        """
+        key = (entity_type, name)
+        try:
+            return self._dispids[key]
+        except KeyError:
+            try:
+                dispid = oleobj.GetIDsOfNames(name)
             except Exception:
-                if attempt < max_retries - 1:
-                    time.sleep(0.01)  # 等待10毫秒后重试
+                dispid = None
+            self._dispids[key] = dispid
+            return dispid
+
+    def _invoke_get(self, oleobj, dispid: int, default=None):
+        """按 DISPID 读取属性，失败时返回默认值
+
+        仅当 AutoCAD 忙 (RPC_E_CALL_REJECTED) 拒绝调用时短暂等待后重试，
+        其他错误直接返回默认值。
+        """
+        for attempt in range(_COM_BUSY_RETRIES + 1):
+            try:
+                return oleobj.Invoke(dispid, 0, _DISPATCH_PROPERTYGET, True)
+            except Exception as e:
+                if (
+                    getattr(e, "hresult", None) == RPC_E_CALL_REJECTED
+                    and attempt < _COM_BUSY_RETRIES
+                ):
+                    time.sleep(0.05)
                     continue
-                # 最后一次尝试仍失败，返回默认值
                 return default
 
+    def _get_properties(self, oleobj, entity_type: str, names: Tuple[str, ...]):
+        """
+        依次读取实体的多个属性，不支持或读取失败的属性返回 None。
+
+        :param oleobj: 实体的原始 IDispatch 接口 (PyIDispatch)
+        :param entity_type: 实体类型 (ObjectName)，用作 DISPID 缓存键
+        :param names: 属性名元组
+        :return: 与 names 对应的属性值列表
+        """
+        get_dispid = self._get_dispid
+        invoke_get = self._invoke_get
+        values = []
+        for name in names:
+            dispid = get_dispid(oleobj, entity_type, name)
+            values.append(None if dispid is None else invoke_get(oleobj, dispid))
+        return values
+
     def _to_int(self, value, default: int = 0) -> int:
         """安全地将值转换为 int，处理 None/未知类型"""
         try:
@@ -320,107 +794,139 @@ class DWGExtractor:
         except Exception:
             return default
 
-    def _extract_text(self, entity):
+    @staticmethod
+    def _to_name(value) -> str:
+        """
+        将图层名、样式名等字符串属性驻留 (sys.intern)。
+
+        大量实体共用少数几个图层/样式，驻留后相同名称只保留一个字符串对象。
+        """
+        return sys.intern(str(value)) if value is not None else ""
+
+    @staticmethod
+    def _xyz(point) -> Tuple[float, float, float]:
+        """将 COM 返回的点解包为 (x, y, z)，二维点的 z 取 0.0"""
+        try:
+            x, y, z = point
+        except ValueError:
+            x, y = point[0], point[1]
+            z = 0.0
+        return x, y, z
+
+    def _extract_text(self, entity, entity_type: str):
         """提取文本元素"""
         try:
             text_elem = TextElement()
 
+            (
+                content,
+                insert_point,
+                height,
+                rotation,
+                color_val,
+                layer,
+                style,
+            ) = self._get_properties(entity, entity_type, _TEXT_PROPERTIES)
+
             # 获取文本内容
-            text_elem.content = str(self._safe_get_attribute(entity, "TextString", ""))
+            text_elem.content = str(content) if content is not None else ""
 
             # 如果文本为空，跳过
             if not text_elem.content:
                 return
 
             # 获取插入点
-            insert_point = self._safe_get_attribute(entity, "InsertionPoint")
+            if not insert_point:
+                (insert_point,) = self._get_properties(entity, entity_type, ("Origin",))
             if insert_point:
-                text_elem.x = insert_point[0]
-                text_elem.y = insert_point[1]
-                text_elem.z = insert_point[2] if len(insert_point) > 2 else 0.0
-            else:
-                origin = self._safe_get_attribute(entity, "Origin")
-                if origin:
-                    text_elem.x = origin[0]
-                    text_elem.y = origin[1]
-                    text_elem.z = origin[2] if len(origin) > 2 else 0.0
+                text_elem.x, text_elem.y, text_elem.z = self._xyz(insert_point)
 
             # 获取其他属性
-            text_elem.height = self._to_float(
-                self._safe_get_attribute(entity, "Height", 0.0), 0.0
-            )
-            text_elem.rotation = self._to_float(
-                self._safe_get_attribute(entity, "Rotation", 0.0), 0.0
-            )
-            color_val = self._safe_get_attribute(entity, "Color", 7)
+            text_elem.height = self._to_float(height, 0.0)
+            text_elem.rotation = self._to_float(rotation, 0.0)
             text_elem.color = int(color_val) if color_val is not None else 7
-            text_elem.layer = str(self._safe_get_attribute(entity, "Layer", ""))
-            text_elem.style = str(self._safe_get_attribute(entity, "StyleName", ""))
+            text_elem.layer = self._to_name(layer)
+            text_elem.style = self._to_name(style)
 
-            self.elements["texts"].append(asdict(text_elem))
+            self.elements["texts"].append(text_elem.to_dict())
 
         except Exception as e:
             self.logger.warning("提取文本元素失败: %s", str(e))
 
-    def _extract_line(self, entity):
+    def _extract_line(self, entity, entity_type: str):
         """提取线条元素"""
         try:
             line_elem = LineElement()
 
+            start, end, lw_val = self._get_properties(
+                entity, entity_type, _LINE_PROPERTIES
+            )
+
             # 获取起点和终点
-            start = self._safe_get_attribute(entity, "StartPoint")
             if start:
-                line_elem.start_x = start[0]
-                line_elem.start_y = start[1]
-                line_elem.start_z = start[2] if len(start) > 2 else 0.0
+                (
+                    line_elem.start_x,
+                    line_elem.start_y,
+                    line_elem.start_z,
+                ) = self._xyz(start)
 
-            end = self._safe_get_attribute(entity, "EndPoint")
             if end:
-                line_elem.end_x = end[0]
-                line_elem.end_y = end[1]
-                line_elem.end_z = end[2] if len(end) > 2 else 0.0
+                line_elem.end_x, line_elem.end_y, line_elem.end_z = self._xyz(end)
             # 获取其他属性
-            lw_val = self._safe_get_attribute(entity, "Lineweight", -1)
             line_elem.lineweight = self._to_int(lw_val, -1)
 
-            self.elements["lines"].append(asdict(line_elem))
+            self.elements["lines"].append(line_elem.to_dict())
 
         except Exception as e:
             self.logger.warning("提取线条元素失败: %s", str(e))
 
-    def _extract_polyline(self, entity):
+    def _extract_polyline(self, entity, entity_type: str):
         """提取多段线元素，识别矩形"""
         try:
-            # 获取顶点坐标
-            vertices = []
-            if hasattr(entity, "Coordinates"):
-                coords = entity.Coordinates
-                # coords 是扁平数组 [x1, y1, x2, y2, ...]
-                for i in range(0, len(coords), 2):
-                    if i + 1 < len(coords):
-                        vertices.append([coords[i], coords[i + 1], 0.0])
-
             # 检查是否为闭合多段线
-            is_closed = entity.Closed if hasattr(entity, "Closed") else False
+            (closed,) = self._get_properties(entity, entity_type, ("Closed",))
+            is_closed = bool(closed)
+            want_rects = self._want_rects and is_closed
 
-            # 记录多段线
-            polyline_data = {
-                "type": "POLYLINE",
-                "vertices": vertices,
-                "is_closed": is_closed,
-                "color": self._to_int(self._safe_get_attribute(entity, "Color", 7), 7),
-                "layer": str(self._safe_get_attribute(entity, "Layer", "")),
-            }
-            self.elements["polylines"].append(polyline_data)
+            # 既不记录多段线、也不可能是矩形时，不再读取坐标
+            if not (self._want_polylines or want_rects):
+                return
+
+            # 获取顶点坐标
+            # Coordinates 只读取一次并整体转为本地 tuple，后续不再经过 COM 包装对象
+            (coords,) = self._get_properties(entity, entity_type, ("Coordinates",))
+            coords = tuple(coords or ())
+            # coords 是扁平数组 [x1, y1, x2, y2, ...]，用切片一次性拆出 x/y 序列
+            xs = coords[0::2]
+            ys = coords[1::2]
+            vertex_count = min(len(xs), len(ys))
 
             # 如果是闭合的4个顶点，可能是矩形
-            if is_closed and len(vertices) == 4:
+            want_rects = want_rects and vertex_count == 4
+            if not (self._want_polylines or want_rects):
+                return
+
+            color_val, layer_val = self._get_properties(
+                entity, entity_type, ("Color", "Layer")
+            )
+            color = self._to_int(color_val, 7)
+            layer = self._to_name(layer_val)
+
+            # 记录多段线
+            if self._want_polylines:
+                polyline_data = {
+                    "type": "POLYLINE",
+                    "vertices": [[x, y, 0.0] for x, y in zip(xs, ys)],
+                    "is_closed": is_closed,
+                    "color": color,
+                    "layer": layer,
+                }
+                self.elements["polylines"].append(polyline_data)
+
+            if want_rects:
                 rect_elem = RectElement()
 
                 # 计算边界框
-                xs = [v[0] for v in vertices]
-                ys = [v[1] for v in vertices]
-
                 min_x, max_x = min(xs), max(xs)
                 min_y, max_y = min(ys), max(ys)
 
@@ -428,37 +934,38 @@ class DWGExtractor:
                 rect_elem.y = min_y
                 rect_elem.width = max_x - min_x
                 rect_elem.height = max_y - min_y
-                color_val = self._safe_get_attribute(entity, "Color", 7)
-                rect_elem.color = int(color_val) if color_val is not None else 7
-                rect_elem.layer = str(self._safe_get_attribute(entity, "Layer", ""))
+                rect_elem.color = color
+                rect_elem.layer = layer
                 rect_elem.is_closed = is_closed
 
-                self.elements["rects"].append(asdict(rect_elem))
+                self.elements["rects"].append(rect_elem.to_dict())
 
         except Exception as e:
             self.logger.warning("提取多段线元素失败: %s", str(e))
 
-    def _extract_circle(self, entity):
+    def _extract_circle(self, entity, entity_type: str):
         """提取圆形元素"""
         try:
             circle_elem = CircleElement()
 
+            center, radius, color_val, layer = self._get_properties(
+                entity, entity_type, _CIRCLE_PROPERTIES
+            )
+
             # 获取圆心和半径
-            center = self._safe_get_attribute(entity, "Center")
             if center:
-                circle_elem.center_x = center[0]
-                circle_elem.center_y = center[1]
-                circle_elem.center_z = center[2] if len(center) > 2 else 0.0
-            circle_elem.radius = self._to_float(
-                self._safe_get_attribute(entity, "Radius", 0.0), 0.0
-            )
+                (
+                    circle_elem.center_x,
+                    circle_elem.center_y,
+                    circle_elem.center_z,
+                ) = self._xyz(center)
+            circle_elem.radius = self._to_float(radius, 0.0)
 
             # 获取其他属性
-            color_val = self._safe_get_attribute(entity, "Color", 7)
             circle_elem.color = int(color_val) if color_val is not None else 7
-            circle_elem.layer = str(self._safe_get_attribute(entity, "Layer", ""))
+            circle_elem.layer = self._to_name(layer)
 
-            self.elements["circles"].append(asdict(circle_elem))
+            self.elements["circles"].append(circle_elem.to_dict())
 
         except Exception as e:
             self.logger.warning("提取圆形元素失败: %s", str(e))
@@ -481,40 +988,54 @@ class DWGExtractor:
 
         return all_elements
 
-    def save_to_csv(self, filepath: str) -> str:
+    def save_to_csv(self, filepath: Union[str, TextIO]) -> str:
         """
         保存提取的元素到CSV文件。
 
-        :param filepath: 输出文件路径
-        :return: 保存的文件路径
+        :param filepath: 输出文件路径，或已打开的文本流（如 io.StringIO）；
+            传入文本流时直接写入，不创建目录、不关闭该流
+        :return: 保存的文件路径；写入文本流时返回空字符串
         """
-        import csv
-
-        all_elements = self.get_all_elements()
+        element_count = sum(len(self.elements[key]) for key in _CSV_BUCKETS)
 
-        if not all_elements:
+        if not element_count:
             self.logger.warning("没有元素数据需要保存")
             return ""
 
         try:
+            if hasattr(filepath, "write"):
+                self._write_csv(filepath)
+                self.logger.info("成功保存 %d 个元素到文本流", element_count)
+                return ""
+
             # 确保输出目录存在
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
-            # 获取所有可能的字段名
-            fieldnames = set()
-            for elem in all_elements:
-                fieldnames.update(elem.keys())
-            fieldnames = sorted(list(fieldnames))
-
-            # 写入 CSV 文件
-            with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(all_elements)
+            with open(
+                filepath, "w", newline="", encoding="utf-8-sig", buffering=1 << 20
+            ) as f:
+                self._write_csv(f)
 
-            self.logger.info("成功保存 %d 个元素到 %s", len(all_elements), filepath)
+            self.logger.info("成功保存 %d 个元素到 %s", element_count, filepath)
             return filepath
 
         except Exception as e:
             self.logger.error("保存CSV文件失败: %s", str(e))
             raise
+
+    def _write_csv(self, f: TextIO) -> None:
+        """写入表头及各类别元素：按类别逐批写出，不再拼接全部元素
+
+        直接用 csv.writer 写出按列顺序预先构造的行，省去 DictWriter
+        逐行检查多余字段、再转换为列表的开销；缺少的字段写为空字符串。
+        """
+        import csv
+
+        fieldnames = _CSV_FIELDNAMES
+        blanks = [""] * len(fieldnames)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        for key in _CSV_BUCKETS:
+            writer.writerows(
+                list(map(elem.get, fieldnames, blanks)) for elem in self.elements[key]
+            )
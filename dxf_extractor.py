@@ -7,15 +7,28 @@ DXF 文件元素提取器
 import os
 import csv
 import logging
-from dataclasses import dataclass, asdict, field
-from typing import List, Dict, Any, Optional
+from itertools import chain
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 import ezdxf
 
 
+class _Record:
+    """元素记录基类：提供比 dataclasses.asdict 更轻量的字典转换"""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        # 字段均为标量或已构造好的顶点列表，无需 asdict 的递归深拷贝
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
 @dataclass
-class TextElement:
+class TextElement(_Record):
     """文本元素数据类"""
 
+    type: str = "text"
     content: str = ""
     x: float = 0.0
     y: float = 0.0
@@ -28,9 +41,10 @@ class TextElement:
 
 
 @dataclass
-class LineElement:
+class LineElement(_Record):
     """线条元素数据类"""
 
+    type: str = "line"
     start_x: float = 0.0
     start_y: float = 0.0
     start_z: float = 0.0
@@ -44,9 +58,10 @@ class LineElement:
 
 
 @dataclass
-class RectElement:
+class RectElement(_Record):
     """矩形元素数据类"""
 
+    type: str = "rect"
     x: float = 0.0
     y: float = 0.0
     width: float = 0.0
@@ -56,9 +71,10 @@ class RectElement:
 
 
 @dataclass
-class CircleElement:
+class CircleElement(_Record):
     """圆形元素数据类"""
 
+    type: str = "circle"
     center_x: float = 0.0
     center_y: float = 0.0
     center_z: float = 0.0
@@ -68,31 +84,115 @@ class CircleElement:
 
 
 @dataclass
-class PolylineElement:
+class PolylineElement(_Record):
     """多段线元素数据类"""
 
+    type: str = "polyline"
     vertices: List[tuple] = field(default_factory=list)
     is_closed: bool = False
     color: int = 7
     layer: str = ""
 
 
+# CSV 中 type 列的取值 -> 对应的元素记录类
+_RECORD_TYPES = {
+    "text": TextElement,
+    "line": LineElement,
+    "rect": RectElement,
+    "circle": CircleElement,
+    "polyline": PolylineElement,
+}
+
+
+@lru_cache(maxsize=None)
+def _csv_fieldnames(types: Tuple[str, ...]) -> List[str]:
+    """根据元素类型计算 CSV 列：type 在第一列，其余为各记录字段的并集（排序）"""
+    names = {f.name for t in types for f in fields(_RECORD_TYPES[t])}
+    names.discard("type")
+    return ["type"] + sorted(names)
+
+
+# type 列的取值 -> self.elements 中的类别
+_ELEMENT_KEYS = {
+    "text": "texts",
+    "line": "lines",
+    "rect": "rects",
+    "circle": "circles",
+    "polyline": "polylines",
+}
+
+
+# 默认导出（文本/线条/矩形/圆形）的 CSV 列，结构在导入时即已确定
+_CSV_FIELDNAMES = _csv_fieldnames(("text", "line", "rect", "circle"))
+
+
+def _format_row(elem: Dict[str, Any], fieldnames: List[str]) -> List[Any]:
+    """按字段顺序构造 CSV 行，浮点数格式化为字符串 (保留4位小数)"""
+    return [
+        f"{v:.4f}" if isinstance(v, float) else v
+        for v in (elem.get(k, "") for k in fieldnames)
+    ]
+
+
+class _RowSink:
+    """流式导出时替代 self.elements 中的列表：append 即写出一行，只保留计数"""
+
+    __slots__ = ("_writer", "_fieldnames", "count")
+
+    def __init__(self, writer, fieldnames: List[str]):
+        self._writer = writer  # None 表示该类型不导出，直接丢弃
+        self._fieldnames = fieldnames
+        self.count = 0
+
+    def append(self, elem: Dict[str, Any]) -> None:
+        self.count += 1
+        if self._writer is not None:
+            self._writer.writerow(_format_row(elem, self._fieldnames))
+
+    def __len__(self) -> int:
+        return self.count
+
+
 class DXFExtractor:
     """DXF 文件元素提取器
 
     一个实例对应一个 DXF 文件。构造时打开文件并初始化元素容器。
     """
 
-    def __init__(self, dxf_path: Optional[str] = None):
+    # DXF 实体类型 -> (启用该类型的配置项, 提取方法名)
+    _HANDLERS = {
+        "TEXT": ("extract_text", "_extract_text"),
+        "MTEXT": ("extract_text", "_extract_text"),
+        "LINE": ("extract_lines", "_extract_line"),
+        "LWPOLYLINE": ("extract_rects", "_extract_polyline"),
+        "POLYLINE": ("extract_rects", "_extract_polyline"),
+        "CIRCLE": ("extract_circles", "_extract_circle"),
+    }
+
+    def __init__(
+        self,
+        dxf_path: Optional[str] = None,
+        streaming: bool = False,
+        keep_rect_polylines: bool = False,
+    ):
         """初始化提取器
 
         Args:
             dxf_path: 可选，DXF 文件路径。传入时会立即打开文件。
+            streaming: 为 True 时不构建完整文档，extract() 通过
+                ezdxf.addons.iterdxf 逐个读取模型空间实体，内存占用与文件大小无关；
+                适用于只需一次提取的大文件，此时 doc/msp 为 None。
+            keep_rect_polylines: 为 True 时识别为矩形的多段线同时记录到 polylines，
+                与 DWG 提取器 COM 后端一致；默认矩形只记录到 rects。
         """
         self.logger = logging.getLogger(__name__)
+        self.streaming = streaming
+        self.keep_rect_polylines = keep_rect_polylines
         self.doc = None
         self.msp = None
         self._dxf_path: Optional[str] = None
+        # get_*_xy() 的坐标列缓存，每次 extract() 时清空
+        self._xy_cache: Dict[str, Tuple[List[float], ...]] = {}
         self.elements: Dict[str, List[Dict[str, Any]]] = {
             "texts": [],
             "lines": [],
@@ -108,13 +208,27 @@ class DXFExtractor:
         """保留4位小数，绝对值小于0.0001则为0.0"""
         if abs(value) < 0.0001:
             return 0.0
-        return float(f"{value:.4f}")
+        # round 与 f"{value:.4f}" 同样按精确十进制值舍入，结果一致，省去字符串往返
+        return round(value, 4)
+
+    def _round_point(self, point) -> Tuple[float, float, float]:
+        """一次解包坐标点 (Vec3 或二维元组) 并逐分量取整，返回 (x, y, z)"""
+        rnd = self._round_coord
+        try:
+            x, y, z = point
+        except ValueError:
+            x, y = point
+            z = 0.0
+        return rnd(x), rnd(y), rnd(z)
 
     def open(self, dxf_path: str) -> None:
         """打开 DXF 文件并准备模型空间"""
         if not os.path.exists(dxf_path):
             raise FileNotFoundError(f"DXF 文件不存在: {dxf_path}")
         self._dxf_path = os.path.abspath(dxf_path)
+        if self.streaming:
+            # 流式模式在 extract() 时才读取文件
+            return
         try:
             self.doc = ezdxf.readfile(self._dxf_path)  # type: ignore
             self.msp = self.doc.modelspace()
@@ -125,10 +239,25 @@ class DXFExtractor:
             raise RuntimeError(f"无法打开 DXF 文件: {str(e)}")
 
     def extract(
-        self, extract_config: Optional[Dict[str, bool]] = None
+        self,
+        extract_config: Optional[Dict[str, bool]] = None,
+        csv_writer=None,
     ) -> Dict[str, List[Dict[str, Any]]]:
-        """从已打开的 DXF 文件中提取元素"""
-        if self.msp is None:
+        """
+        从已打开的 DXF 文件中提取元素
+
+        Args:
+            extract_config: 提取配置
+            csv_writer: 可选的 csv.writer；提供时每个元素提取后立即写出一行
+                (列为 _CSV_FIELDNAMES，不含多段线)，不在内存中保留元素，
+                返回的各类型仅记录数量
+
+        Returns:
+            包含各类元素的字典。未提供 csv_writer 时该字典即 self.elements，
+            字典及其中的列表在下一次 extract() 时会被原地清空并重新填充；
+            需要保留结果时请先复制，如 {k: list(v) for k, v in elements.items()}
+        """
+        if self.msp is None and not (self.streaming and self._dxf_path):
             raise RuntimeError("DXF 文件尚未打开，请先调用 open() 或在构造函数传入路径")
 
         # 默认配置
@@ -140,53 +269,51 @@ class DXFExtractor:
                 "extract_circles": True,
             }
 
+        buckets = self.elements
         try:
-            # 重置元素列表
-            self.elements = {
-                "texts": [],
-                "lines": [],
-                "rects": [],
-                "circles": [],
-                "polylines": [],
+            # 重置元素列表：原地清空，批量处理时不反复分配，列表对象保持不变
+            for bucket in buckets.values():
+                bucket.clear()
+            self._xy_cache.clear()
+            if csv_writer is not None:
+                # 流式导出期间临时以写出器替代列表，结束后恢复
+                self.elements = {
+                    "texts": _RowSink(csv_writer, _CSV_FIELDNAMES),
+                    "lines": _RowSink(csv_writer, _CSV_FIELDNAMES),
+                    "rects": _RowSink(csv_writer, _CSV_FIELDNAMES),
+                    "circles": _RowSink(csv_writer, _CSV_FIELDNAMES),
+                    "polylines": _RowSink(None, _CSV_FIELDNAMES),
+                }
+
+            # 按配置预先构建 实体类型 -> 提取方法 的分派表，并据此构建查询，
+            # 由 ezdxf 预先过滤掉不需要的实体，循环内只需一次字典查找
+            handlers = {
+                dxf_type: getattr(self, method_name)
+                for dxf_type, (config_key, method_name) in self._HANDLERS.items()
+                if extract_config.get(config_key, True)
             }
+            if not handlers:
+                self.logger.warning("提取配置未启用任何元素类型")
+                return self.elements
+            get_handler = handlers.get
 
-            # 统计实体数量
-            entity_count = len(list(self.msp))
-            self.logger.info("模型空间中共有 %d 个实体", entity_count)
+            if self.streaming:
+                entities = self._iter_modelspace(sorted(handlers))
+            else:
+                # 统计实体数量
+                entity_count = len(self.msp)
+                self.logger.info("模型空间中共有 %d 个实体", entity_count)
+                entities = self.msp.query(" ".join(sorted(handlers)))
 
-            # 遍历所有实体
-            for entity in self.msp:
+            # 遍历所需实体
+            for entity in entities:
                 entity_type = "Unknown"  # 初始化默认值
                 try:
                     entity_type = entity.dxftype()
 
-                    # 提取文本元素
-                    if extract_config.get("extract_text", True) and entity_type in [
-                        "TEXT",
-                        "MTEXT",
-                    ]:
-                        self._extract_text(entity)
-
-                    # 提取线条元素
-                    elif (
-                        extract_config.get("extract_lines", True)
-                        and entity_type == "LINE"
-                    ):
-                        self._extract_line(entity)
-
-                    # 提取多段线（可能是矩形）
-                    elif extract_config.get("extract_rects", True) and entity_type in [
-                        "LWPOLYLINE",
-                        "POLYLINE",
-                    ]:
-                        self._extract_polyline(entity)
-
-                    # 提取圆形
-                    elif (
-                        extract_config.get("extract_circles", True)
-                        and entity_type == "CIRCLE"
-                    ):
-                        self._extract_circle(entity)
+                    handler = get_handler(entity_type)
+                    if handler is not None:
+                        handler(entity)
 
                 except Exception as e:
                     self.logger.warning(
@@ -208,6 +335,20 @@ class DXFExtractor:
             self.logger.error("读取 DXF 文件失败: %s", str(e))
             raise
 
+        finally:
+            self.elements = buckets
+
+    def _iter_modelspace(self, types: List[str]):
+        """流式模式：用 iterdxf 逐个产出模型空间中指定类型的实体"""
+        from ezdxf.addons import iterdxf
+
+        self.logger.info("流式读取文件: %s", self._dxf_path)
+        doc = iterdxf.opendxf(self._dxf_path)
+        try:
+            yield from doc.modelspace(types=types)
+        finally:
+            doc.close()
+
     # 输出方法：按元素类型返回
     def get_texts(self) -> List[Dict[str, Any]]:
         return self.elements.get("texts", [])
@@ -224,39 +365,59 @@ class DXFExtractor:
     def get_polylines(self) -> List[Dict[str, Any]]:
         return self.elements.get("polylines", [])
 
+    # 坐标列输出：按列返回已取整的浮点坐标，结果缓存到下一次 extract()
+    def get_texts_xy(self) -> Tuple[List[float], List[float]]:
+        """返回所有文本插入点的 (xs, ys)，与 get_texts() 一一对应"""
+        cached = self._xy_cache.get("texts")
+        if cached is None:
+            texts = self.get_texts()
+            cached = self._xy_cache["texts"] = (
+                [text["x"] for text in texts],
+                [text["y"] for text in texts],
+            )
+        return cached
+
+    def get_lines_xy(
+        self,
+    ) -> Tuple[List[float], List[float], List[float], List[float]]:
+        """返回所有线条的 (start_xs, start_ys, end_xs, end_ys)，与 get_lines() 一一对应"""
+        cached = self._xy_cache.get("lines")
+        if cached is None:
+            lines = self.get_lines()
+            cached = self._xy_cache["lines"] = (
+                [line["start_x"] for line in lines],
+                [line["start_y"] for line in lines],
+                [line["end_x"] for line in lines],
+                [line["end_y"] for line in lines],
+            )
+        return cached
+
     def _extract_text(self, entity):
         """提取文本元素"""
         try:
+            dxf = entity.dxf
             text_elem = TextElement()
 
             # 获取文本内容
-            text_elem.content = entity.dxf.text if hasattr(entity.dxf, "text") else ""
+            text_elem.content = getattr(dxf, "text", "")
 
             # 如果文本为空，跳过
             if not text_elem.content:
                 return
 
             # 获取插入点
-            if hasattr(entity.dxf, "insert"):
-                insert_point = entity.dxf.insert
-                text_elem.x = self._round_coord(insert_point[0])
-                text_elem.y = self._round_coord(insert_point[1])
-                text_elem.z = self._round_coord(
-                    insert_point[2] if len(insert_point) > 2 else 0.0
-                )
+            insert = getattr(dxf, "insert", None)
+            if insert is not None:
+                text_elem.x, text_elem.y, text_elem.z = self._round_point(insert)
 
             # 获取其他属性
-            text_elem.height = (
-                entity.dxf.height if hasattr(entity.dxf, "height") else 0.0
-            )
-            text_elem.rotation = (
-                entity.dxf.rotation if hasattr(entity.dxf, "rotation") else 0.0
-            )
-            text_elem.color = entity.dxf.color if hasattr(entity.dxf, "color") else 7
-            text_elem.layer = entity.dxf.layer if hasattr(entity.dxf, "layer") else ""
-            text_elem.style = entity.dxf.style if hasattr(entity.dxf, "style") else ""
+            text_elem.height = getattr(dxf, "height", 0.0)
+            text_elem.rotation = getattr(dxf, "rotation", 0.0)
+            text_elem.color = getattr(dxf, "color", 7)
+            text_elem.layer = getattr(dxf, "layer", "")
+            text_elem.style = getattr(dxf, "style", "")
 
-            self.elements["texts"].append(asdict(text_elem))
+            self.elements["texts"].append(text_elem.to_dict())
 
         except Exception as e:
             self.logger.warning("提取文本元素失败: %s", str(e))
@@ -264,34 +425,29 @@ class DXFExtractor:
     def _extract_line(self, entity):
         """提取线条元素"""
         try:
+            dxf = entity.dxf
             line_elem = LineElement()
 
             # 获取起点和终点
-            if hasattr(entity.dxf, "start"):
-                start = entity.dxf.start
-                line_elem.start_x = self._round_coord(start[0])
-                line_elem.start_y = self._round_coord(start[1])
-                line_elem.start_z = self._round_coord(
-                    start[2] if len(start) > 2 else 0.0
+            start = getattr(dxf, "start", None)
+            if start is not None:
+                line_elem.start_x, line_elem.start_y, line_elem.start_z = (
+                    self._round_point(start)
                 )
 
-            if hasattr(entity.dxf, "end"):
-                end = entity.dxf.end
-                line_elem.end_x = self._round_coord(end[0])
-                line_elem.end_y = self._round_coord(end[1])
-                line_elem.end_z = self._round_coord(end[2] if len(end) > 2 else 0.0)
+            end = getattr(dxf, "end", None)
+            if end is not None:
+                line_elem.end_x, line_elem.end_y, line_elem.end_z = (
+                    self._round_point(end)
+                )
 
             # 获取其他属性
-            line_elem.color = entity.dxf.color if hasattr(entity.dxf, "color") else 7
-            line_elem.layer = entity.dxf.layer if hasattr(entity.dxf, "layer") else ""
-            line_elem.linetype = (
-                entity.dxf.linetype if hasattr(entity.dxf, "linetype") else ""
-            )
-            line_elem.lineweight = (
-                entity.dxf.lineweight if hasattr(entity.dxf, "lineweight") else -1
-            )
+            line_elem.color = getattr(dxf, "color", 7)
+            line_elem.layer = getattr(dxf, "layer", "")
+            line_elem.linetype = getattr(dxf, "linetype", "")
+            line_elem.lineweight = getattr(dxf, "lineweight", -1)
 
-            self.elements["lines"].append(asdict(line_elem))
+            self.elements["lines"].append(line_elem.to_dict())
 
         except Exception as e:
             self.logger.warning("提取线条元素失败: %s", str(e))
@@ -299,6 +455,7 @@ class DXFExtractor:
     def _extract_polyline(self, entity):
         """提取多段线元素，识别矩形"""
         try:
+            dxf = entity.dxf
             # 获取顶点
             vertices = []
             if hasattr(entity, "get_points"):
@@ -325,30 +482,25 @@ class DXFExtractor:
                 return
 
             # 检查是否闭合
-            is_closed = entity.is_closed if hasattr(entity, "is_closed") else False
+            is_closed = getattr(entity, "is_closed", False)
 
             # 如果是闭合的4边形，尝试识别为矩形
             if is_closed and len(vertices) == 4:
                 # 检查是否为矩形（简化判断：检查是否有水平和垂直边）
-                x_coords = [v[0] for v in vertices]
-                y_coords = [v[1] for v in vertices]
+                x_coords, y_coords, _ = zip(*vertices)
 
                 min_x, max_x = min(x_coords), max(x_coords)
                 min_y, max_y = min(y_coords), max(y_coords)
 
                 # 检查是否所有点都在边界上
                 tolerance = 0.01
-                is_rect = True
-                for x, y, _ in vertices:
-                    on_edge = (
-                        abs(x - min_x) < tolerance
-                        or abs(x - max_x) < tolerance
-                        or abs(y - min_y) < tolerance
-                        or abs(y - max_y) < tolerance
-                    )
-                    if not on_edge:
-                        is_rect = False
-                        break
+                is_rect = all(
+                    abs(x - min_x) < tolerance
+                    or abs(x - max_x) < tolerance
+                    or abs(y - min_y) < tolerance
+                    or abs(y - max_y) < tolerance
+                    for x, y in zip(x_coords, y_coords)
+                )
 
                 if is_rect:
                     rect_elem = RectElement()
@@ -356,28 +508,21 @@ class DXFExtractor:
                     rect_elem.y = self._round_coord(min_y)
                     rect_elem.width = self._round_coord(max_x - min_x)
                     rect_elem.height = self._round_coord(max_y - min_y)
-                    rect_elem.color = (
-                        entity.dxf.color if hasattr(entity.dxf, "color") else 7
-                    )
-                    rect_elem.layer = (
-                        entity.dxf.layer if hasattr(entity.dxf, "layer") else ""
-                    )
+                    rect_elem.color = getattr(dxf, "color", 7)
+                    rect_elem.layer = getattr(dxf, "layer", "")
 
-                    self.elements["rects"].append(asdict(rect_elem))
-                    return
+                    self.elements["rects"].append(rect_elem.to_dict())
+                    if not self.keep_rect_polylines:
+                        return
 
-            # 否则作为普通多段线保存
+            # 作为普通多段线保存（keep_rect_polylines 时矩形也一并记录）
             polyline_elem = PolylineElement()
             polyline_elem.vertices = vertices
             polyline_elem.is_closed = is_closed
-            polyline_elem.color = (
-                entity.dxf.color if hasattr(entity.dxf, "color") else 7
-            )
-            polyline_elem.layer = (
-                entity.dxf.layer if hasattr(entity.dxf, "layer") else ""
-            )
+            polyline_elem.color = getattr(dxf, "color", 7)
+            polyline_elem.layer = getattr(dxf, "layer", "")
 
-            self.elements["polylines"].append(asdict(polyline_elem))
+            self.elements["polylines"].append(polyline_elem.to_dict())
 
         except Exception as e:
             self.logger.warning("提取多段线元素失败: %s", str(e))
@@ -385,27 +530,24 @@ class DXFExtractor:
     def _extract_circle(self, entity):
         """提取圆形元素"""
         try:
+            dxf = entity.dxf
             circle_elem = CircleElement()
 
             # 获取圆心
-            if hasattr(entity.dxf, "center"):
-                center = entity.dxf.center
-                circle_elem.center_x = self._round_coord(center[0])
-                circle_elem.center_y = self._round_coord(center[1])
-                circle_elem.center_z = self._round_coord(
-                    center[2] if len(center) > 2 else 0.0
+            center = getattr(dxf, "center", None)
+            if center is not None:
+                circle_elem.center_x, circle_elem.center_y, circle_elem.center_z = (
+                    self._round_point(center)
                 )
 
             # 获取半径
-            circle_elem.radius = self._round_coord(
-                entity.dxf.radius if hasattr(entity.dxf, "radius") else 0.0
-            )
+            circle_elem.radius = self._round_coord(getattr(dxf, "radius", 0.0))
 
             # 获取其他属性
-            circle_elem.color = entity.dxf.color if hasattr(entity.dxf, "color") else 7
-            circle_elem.layer = entity.dxf.layer if hasattr(entity.dxf, "layer") else ""
+            circle_elem.color = getattr(dxf, "color", 7)
+            circle_elem.layer = getattr(dxf, "layer", "")
 
-            self.elements["circles"].append(asdict(circle_elem))
+            self.elements["circles"].append(circle_elem.to_dict())
 
         except Exception as e:
             self.logger.warning("提取圆形元素失败: %s", str(e))
@@ -417,33 +559,15 @@ class DXFExtractor:
         Returns:
             包含所有元素的列表，每个元素都有 type 字段标识类型
         """
-        all_elements = []
-
-        # 添加文本元素
-        for text in self.elements["texts"]:
-            element = text.copy()
-            element["type"] = "text"
-            all_elements.append(element)
-
-        # 添加线条元素
-        for line in self.elements["lines"]:
-            element = line.copy()
-            element["type"] = "line"
-            all_elements.append(element)
-
-        # 添加矩形元素
-        for rect in self.elements["rects"]:
-            element = rect.copy()
-            element["type"] = "rect"
-            all_elements.append(element)
-
-        # 添加圆形元素
-        for circle in self.elements["circles"]:
-            element = circle.copy()
-            element["type"] = "circle"
-            all_elements.append(element)
-
-        return all_elements
+        # 元素在提取时已带 type 字段，直接串联各类别，不复制字典
+        return list(
+            chain(
+                self.elements["texts"],
+                self.elements["lines"],
+                self.elements["rects"],
+                self.elements["circles"],
+            )
+        )
 
     def save_to_csv(self, output_path: str, types: Optional[List[str]] = None) -> None:
         """
@@ -454,73 +578,99 @@ class DXFExtractor:
             types: 需要保存的元素类型列表，如 ["text","line","rect","circle","polyline"]
         """
         try:
-            # 获取所有元素
+            # 选出需要保存的类别；CSV 列由元素记录类决定，无需逐个扫描元素的字段
             if types:
-                selected = []
-                mapping = {
-                    "text": "texts",
-                    "line": "lines",
-                    "rect": "rects",
-                    "circle": "circles",
-                    "polyline": "polylines",
-                }
-                for t in types:
-                    key = mapping.get(t)
-                    if key and key in self.elements:
-                        for elem in self.elements[key]:
-                            e = elem.copy()
-                            e["type"] = t
-                            selected.append(e)
-                all_elements = selected
+                types = [t for t in types if t in _RECORD_TYPES]
+                buckets = [self.elements.get(_ELEMENT_KEYS[t], []) for t in types]
+                fieldnames = _csv_fieldnames(tuple(types))
             else:
-                all_elements = self.get_all_elements()
+                buckets = [
+                    self.elements[key] for key in ("texts", "lines", "rects", "circles")
+                ]
+                fieldnames = _CSV_FIELDNAMES
 
-            if not all_elements:
+            total = sum(len(bucket) for bucket in buckets)
+            if not total:
                 self.logger.warning("没有元素可保存")
                 return
 
             # 确保输出目录存在
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-            # 获取所有可能的字段
-            fieldnames = set()
-            for element in all_elements:
-                fieldnames.update(element.keys())
-
-            # 确保 type 字段在第一列
-            fieldnames = ["type"] + sorted([f for f in fieldnames if f != "type"])
-
-            # 格式化浮点数为字符串 (保留4位小数)
-            formatted_elements = []
-            for elem in all_elements:
-                new_elem = elem.copy()
-                for k, v in new_elem.items():
-                    if isinstance(v, float):
-                        new_elem[k] = f"{v:.4f}"
-                formatted_elements.append(new_elem)
-
-            # 写入 CSV
+            # 写入 CSV：逐个元素按字段顺序构造行，浮点数格式化为字符串 (保留4位小数)
             with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(formatted_elements)
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
+                writer.writerows(
+                    _format_row(elem, fieldnames) for elem in chain(*buckets)
+                )
 
-            self.logger.info("成功保存 %d 个元素到: %s", len(all_elements), output_path)
+            self.logger.info("成功保存 %d 个元素到: %s", total, output_path)
 
         except Exception as e:
             self.logger.error("保存 CSV 文件失败: %s", str(e))
             raise
 
+    def extract_to_csv(
+        self, output_path: str, extract_config: Optional[Dict[str, bool]] = None
+    ) -> Dict[str, int]:
+        """
+        边提取边写入 CSV，适用于实体数量很大的文件
+
+        元素按图纸中的实体顺序写出，不在内存中缓存；提取后 self.elements
+        中不保留元素，如需 get_*() 请使用 extract() + save_to_csv()。
+
+        Returns:
+            各类元素数量
+        """
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        with open(
+            output_path, "w", newline="", encoding="utf-8", buffering=1 << 20
+        ) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(_CSV_FIELDNAMES)
+            sinks = self.extract(extract_config, csv_writer=writer)
+
+        counts = {key: len(sink) for key, sink in sinks.items()}
+        self.logger.info("成功流式保存元素到: %s", output_path)
+        return counts
+
     # 以上是实例级 API：
     # 1) extract() + get_all_elements() -> List[Dict]
     # 2) extract() + save_to_csv() -> 写入 CSV
+    # 3) extract_to_csv() -> 边提取边写入 CSV
 
 
 # 示例用法
+def _process_file(
+    dxf_path: str, output_dir: str
+) -> Tuple[Optional[Dict[str, int]], str]:
+    """
+    提取单个 DXF 文件并保存为 CSV（批处理时在工作进程中执行）
+
+    Returns:
+        成功时返回 (各类元素数量, 输出路径)，失败时返回 (None, 错误信息)
+    """
+    try:
+        # 生成输出文件名 (使用原文件名)
+        stem = os.path.splitext(os.path.basename(dxf_path))[0]
+        output_path = os.path.join(output_dir, stem + "_elements.csv")
+
+        # 边提取边写入 CSV，不在内存中缓存全部元素
+        extractor = DXFExtractor(dxf_path)
+        return extractor.extract_to_csv(output_path), output_path
+    except Exception as e:
+        return None, str(e)
+
+
 if __name__ == "__main__":
     # 配置日志
     try:
-        from logging_config import setup_logger
+        from logging_config import (
+            forward_worker_logs,
+            init_worker_logging,
+            setup_logger,
+        )
 
         setup_logger(
             log_level=logging.INFO,
@@ -539,6 +689,7 @@ if __name__ == "__main__":
                 logging.StreamHandler(),
             ],
         )
+        forward_worker_logs = None
 
     from pathlib import Path
 
@@ -560,35 +711,39 @@ if __name__ == "__main__":
         success_count = 0
         fail_count = 0
 
-        # 遍历处理每个 DXF 文件
-        for dxf_file in dxf_files:
-            print(f"正在处理: {dxf_file.name}")
+        # 文件之间相互独立，按文件分发到多个进程并行提取；
+        # 工作进程的日志经队列发回主进程，写入同一个日志文件
+        from concurrent.futures import ProcessPoolExecutor
+        from contextlib import nullcontext
+        from itertools import repeat
+
+        workers = min(len(dxf_files), os.cpu_count() or 1)
+        log_forwarding = forward_worker_logs() if forward_worker_logs else nullcontext()
+        with log_forwarding as log_args, ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker_logging if log_args else None,
+            initargs=log_args or (),
+        ) as executor:
+            outcomes = executor.map(
+                _process_file, [str(f) for f in dxf_files], repeat(str(output_dir))
+            )
+            for dxf_file, (counts, result) in zip(dxf_files, outcomes):
+                print(f"正在处理: {dxf_file.name}")
 
-            try:
-                # 创建提取器并提取
-                extractor = DXFExtractor(str(dxf_file))
-                elements = extractor.extract()
+                if counts is None:
+                    print(f"  [FAILED] 提取失败: {result}\n")
+                    fail_count += 1
+                    continue
 
                 print("  提取结果:")
-                print(f"  - 文本: {len(elements['texts'])} 个")
-                print(f"  - 线条: {len(elements['lines'])} 个")
-                print(f"  - 矩形: {len(elements['rects'])} 个")
-                print(f"  - 圆形: {len(elements['circles'])} 个")
-
-                # 生成输出文件名 (使用原文件名)
-                output_filename = dxf_file.stem + "_elements.csv"
-                output_path = output_dir / output_filename
-
-                # 保存到 CSV
-                extractor.save_to_csv(str(output_path))
-                print(f"  [SUCCESS] 已保存到: {output_path}\n")
+                print(f"  - 文本: {counts['texts']} 个")
+                print(f"  - 线条: {counts['lines']} 个")
+                print(f"  - 矩形: {counts['rects']} 个")
+                print(f"  - 圆形: {counts['circles']} 个")
+                print(f"  [SUCCESS] 已保存到: {result}\n")
 
                 success_count += 1
 
-            except Exception as e:
-                print(f"  [FAILED] 提取失败: {e}\n")
-                fail_count += 1
-
         # 输出总结
         print("=" * 50)
         print("处理完成!")
@@ -2,8 +2,11 @@ import csv
 import json
 import logging
 import os
-from collections import defaultdict, deque
-from typing import Any, Dict, List, Optional, Set, Tuple
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 try:
     import yaml
@@ -15,18 +18,23 @@ except ImportError as exc:  # pragma: no cover
 from dxf_extractor import DXFExtractor
 from logging_config import setup_logger
 
+# 优先使用 libyaml 的 C 实现加载器，未编译 libyaml 时回退到纯 Python 版本
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(BASE_DIR, "config.yaml")
 PRIVATE_CONFIG_PATH = os.path.join(BASE_DIR, "private.yaml")
 
 
 def _load_yaml(path: str, *, required: bool = False) -> Dict[str, Any]:
-    if not os.path.exists(path):
+    try:
+        f = open(path, "rb", buffering=1 << 16)
+    except FileNotFoundError:
         if required:
             raise FileNotFoundError(f"配置文件不存在: {path}")
         return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    with f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
 
 
 def _deep_update(target: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
@@ -48,6 +56,7 @@ def load_config(
     return base_cfg
 
 
+@lru_cache(maxsize=64)
 def resolve_path(path_value: Optional[str]) -> Optional[str]:
     if not path_value:
         return None
@@ -62,6 +71,74 @@ def parse_log_level(level_name: Optional[str], default: int = logging.INFO) -> i
     return getattr(logging, str(level_name).upper(), default)
 
 
+@dataclass(frozen=True)
+class LocatorPaths:
+    """grid_locator 配置中引用的路径，启动时统一解析一次"""
+
+    dxf_file: Optional[str]
+    grid_json: Optional[str]
+    output_csv: str
+    log_file: str
+
+    @classmethod
+    def from_config(cls, locator_cfg: Dict[str, Any]) -> "LocatorPaths":
+        return cls(
+            dxf_file=resolve_path(locator_cfg.get("dxf_file")),
+            grid_json=resolve_path(locator_cfg.get("grid_json")),
+            output_csv=resolve_path(locator_cfg.get("output_csv"))
+            or os.path.join(BASE_DIR, "output", "text_positions.csv"),
+            log_file=resolve_path(locator_cfg.get("log", {}).get("file"))
+            or os.path.join(BASE_DIR, "logs", "grid_locator.log"),
+        )
+
+
+# 视为已是数值坐标、无需再转换的类型
+_NUMBER_TYPES = (int, float)
+
+# 轴网定位结果的字段（locate_point 返回的键）
+_LOCATION_FIELDS = (
+    "nearest_x_axis",
+    "nearest_y_axis",
+    "x_span_start",
+    "x_span_end",
+    "y_span_start",
+    "y_span_end",
+)
+
+# 文字定位 CSV 的列
+_TEXT_POSITION_FIELDS = ("content", "x", "y") + _LOCATION_FIELDS
+
+
+class ClosedSpace(NamedTuple):
+    """闭合空间检测结果；_fields 即输出列顺序，可直接交给 csv.writer"""
+
+    line_count: int
+    node_count: int
+    center_x: float
+    center_y: float
+    nearest_x_axis: Optional[str]
+    nearest_y_axis: Optional[str]
+    x_span_start: Optional[str]
+    x_span_end: Optional[str]
+    y_span_start: Optional[str]
+    y_span_end: Optional[str]
+
+
+class OpenLine(NamedTuple):
+    """未闭合线段的定位结果；line_index 为线段在输入列表中的下标"""
+
+    line_index: int
+    layer: Optional[str]
+    mid_x: float
+    mid_y: float
+    nearest_x_axis: Optional[str]
+    nearest_y_axis: Optional[str]
+    x_span_start: Optional[str]
+    x_span_end: Optional[str]
+    y_span_start: Optional[str]
+    y_span_end: Optional[str]
+
+
 class AxisGrid:
     """根据轴网 JSON 计算任意实体的轴位信息"""
 
@@ -77,13 +154,25 @@ class AxisGrid:
         self.x_axes = sorted(grid_data.get("x_axes", []), key=lambda a: a["coordinate"])
         self.y_axes = sorted(grid_data.get("y_axes", []), key=lambda a: a["coordinate"])
 
+        # 有序坐标与标签分开存放，定位时对坐标二分查找
+        self._x_coords = [axis["coordinate"] for axis in self.x_axes]
+        self._x_labels = [axis.get("label") for axis in self.x_axes]
+        self._y_coords = [axis["coordinate"] for axis in self.y_axes]
+        self._y_labels = [axis.get("label") for axis in self.y_axes]
+
     @classmethod
     def from_file(cls, grid_json_path: str) -> "AxisGrid":
         return cls(grid_json_path)
 
     @classmethod
     def load_grid(cls, grid_json: str, logger: logging.Logger) -> "AxisGrid":
-        grid = cls.from_file(grid_json)
+        """载入轴网；同一文件未修改时复用已解析的 AxisGrid"""
+        path = os.path.abspath(grid_json)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            raise FileNotFoundError(f"轴网 JSON 文件不存在: {grid_json}")
+        grid = _load_grid_cached(cls, path, mtime_ns)
         logger.info(
             "载入轴网数据: X轴 %d 条, Y轴 %d 条",
             len(grid.x_axes),
@@ -101,90 +190,99 @@ class AxisGrid:
     ) -> None:
         texts = extract_texts(dxf_path, logger)
         grid = cls.load_grid(grid_json, logger)
+        grid.locate_texts(texts, output_csv, logger)
 
-        results: List[Dict[str, Any]] = []
-        for text in texts:
-            try:
-                x = float(text["x"])
-                y = float(text["y"])
-            except (KeyError, ValueError, TypeError):
-                logger.debug("跳过无法解析坐标的文字: %s", text)
-                continue
-
-            location = grid.locate_entity(
-                {"type": "text", "content": text.get("content"), "x": x, "y": y}
-            )
-            results.append(
-                {
-                    "content": text.get("content", "").strip(),
-                    "x": f"{x:.4f}",
-                    "y": f"{y:.4f}",
-                    **location,
-                }
-            )
-
-        if not results:
+    def locate_texts(
+        self,
+        texts: List[Dict[str, Any]],
+        output_csv: str,
+        logger: logging.Logger,
+        xy: Optional[Tuple[List[float], List[float]]] = None,
+    ) -> None:
+        """定位已提取的文字元素并输出 CSV
+
+        xy 为与 texts 一一对应的坐标列（如 DXFExtractor.get_texts_xy()），
+        提供时直接使用，不再逐条解析坐标。
+        """
+        if xy is not None:
+            valid_texts = texts
+            xs, ys = xy
+        else:
+            valid_texts = []
+            xs = []
+            ys = []
+            skipped = 0
+            debug = logger.isEnabledFor(logging.DEBUG)
+            for text in texts:
+                x = text.get("x")
+                y = text.get("y")
+                # 坐标通常已是数值，仅对字符串等其它类型尝试转换
+                if not (isinstance(x, _NUMBER_TYPES) and isinstance(y, _NUMBER_TYPES)):
+                    try:
+                        x = float(x)  # type: ignore[arg-type]
+                        y = float(y)  # type: ignore[arg-type]
+                    except (ValueError, TypeError):
+                        skipped += 1
+                        if debug:
+                            logger.debug("跳过无法解析坐标的文字: %s", text)
+                        continue
+                valid_texts.append(text)
+                xs.append(x)
+                ys.append(y)
+            if skipped:
+                logger.info("跳过 %d 条无法解析坐标的文字", skipped)
+
+        if not valid_texts:
             logger.warning("未生成任何文字定位结果")
             return
 
         os.makedirs(os.path.dirname(output_csv), exist_ok=True)
-        fieldnames = [
-            "content",
-            "x",
-            "y",
-            "nearest_x_axis",
-            "nearest_y_axis",
-            "x_span_start",
-            "x_span_end",
-            "y_span_start",
-            "y_span_end",
-        ]
-
-        with open(output_csv, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(results)
-
-        logger.info("已输出 %d 条文字的轴网定位: %s", len(results), output_csv)
 
-    @staticmethod
-    def _nearest_axis(
-        axes: List[Dict[str, Any]], coord: float
-    ) -> Optional[Dict[str, Any]]:
-        if not axes:
-            return None
-        return min(axes, key=lambda axis: abs(axis["coordinate"] - coord))
+        # 按列顺序直接生成行元组，边定位边写入，不保留中间结果
+        locate = self._locate_labels
+        rows = (
+            (text.get("content", "").strip(), round(x, 4), round(y, 4), *locate(x, y))
+            for text, x, y in zip(valid_texts, xs, ys)
+        )
+        with open(
+            output_csv, "w", newline="", encoding="utf-8", buffering=1 << 20
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(_TEXT_POSITION_FIELDS)
+            writer.writerows(rows)
+
+        logger.info("已输出 %d 条文字的轴网定位: %s", len(valid_texts), output_csv)
 
     @staticmethod
-    def _span(
-        axes: List[Dict[str, Any]], coord: float
-    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
-        if not axes:
-            return None, None
-        previous = None
-        for axis in axes:
-            if coord < axis["coordinate"]:
-                return previous, axis
-            previous = axis
-        return previous, None
+    def _axis_lookup(
+        coords: List[float], labels: List[Optional[str]], coord: float
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """二分查找坐标所在跨距，返回 (最近轴, 跨距起点轴, 跨距终点轴) 的标签"""
+        if not coords:
+            return None, None, None
+        # 跨距终点为第一条坐标大于 coord 的轴，起点为其前一条
+        index = bisect_right(coords, coord)
+        prev_label = labels[index - 1] if index > 0 else None
+        next_label = labels[index] if index < len(coords) else None
+
+        # 最近轴只可能是跨距两端之一；距离相等时取坐标较小的一侧，
+        # 同坐标的多条轴取排序后的第一条
+        if index < len(coords) and (
+            index == 0 or coords[index] - coord < coord - coords[index - 1]
+        ):
+            nearest = index
+        else:
+            nearest = bisect_left(coords, coords[index - 1], 0, index)
+        return labels[nearest], prev_label, next_label
+
+    def _locate_labels(self, x: float, y: float) -> Tuple[Optional[str], ...]:
+        """返回按 _LOCATION_FIELDS 顺序排列的定位标签元组"""
+        nearest_x, x_start, x_end = self._axis_lookup(self._x_coords, self._x_labels, x)
+        nearest_y, y_start, y_end = self._axis_lookup(self._y_coords, self._y_labels, y)
+        return nearest_x, nearest_y, x_start, x_end, y_start, y_end
 
     def locate_point(self, x: float, y: float) -> Dict[str, Optional[str]]:
-        vx_prev, vx_next = self._span(self.x_axes, x)
-        vy_prev, vy_next = self._span(self.y_axes, y)
-        nearest_x = self._nearest_axis(self.x_axes, x)
-        nearest_y = self._nearest_axis(self.y_axes, y)
-
-        def axis_label(axis: Optional[Dict[str, Any]]) -> Optional[str]:
-            return axis.get("label") if axis else None
-
-        return {
-            "nearest_x_axis": axis_label(nearest_x),
-            "nearest_y_axis": axis_label(nearest_y),
-            "x_span_start": axis_label(vx_prev),
-            "x_span_end": axis_label(vx_next),
-            "y_span_start": axis_label(vy_prev),
-            "y_span_end": axis_label(vy_next),
-        }
+        return dict(zip(_LOCATION_FIELDS, self._locate_labels(x, y)))
 
     def locate_entity(self, entity: Dict[str, Any]) -> Dict[str, Optional[str]]:
         """根据实体的空间信息返回轴网定位，目前支持文字（x,y)."""
@@ -209,7 +307,7 @@ class AxisGrid:
         *,
         min_lines: int = 4,
         tolerance: float = 1e-3,
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    ) -> Dict[str, List[Any]]:
         grid = cls.load_grid(grid_json, logger)
         extractor = DXFExtractor(dxf_path)
         extractor.extract(
@@ -220,13 +318,34 @@ class AxisGrid:
                 "extract_circles": False,
             }
         )
-        lines = extractor.get_lines()
+        return grid.locate_spaces(
+            extractor.get_lines(),
+            logger,
+            min_lines=min_lines,
+            tolerance=tolerance,
+            xy=extractor.get_lines_xy(),
+        )
+
+    def locate_spaces(
+        self,
+        lines: List[Dict[str, Any]],
+        logger: logging.Logger,
+        *,
+        min_lines: int = 4,
+        tolerance: float = 1e-3,
+        xy: Optional[Tuple[List[float], ...]] = None,
+    ) -> Dict[str, List[Any]]:
+        """对已提取的线条做闭合空间检测并定位
+
+        xy 为与 lines 一一对应的 (起点x, 起点y, 终点x, 终点y) 坐标列
+        （如 DXFExtractor.get_lines_xy()），提供时不再逐条解析坐标。
+        """
         if not lines:
             logger.warning("DXF 中未找到线条实体")
             return {"closed_spaces": [], "open_lines": []}
 
-        return grid._locate_line_spaces(
-            lines, logger, min_lines=min_lines, tolerance=tolerance
+        return self._locate_line_spaces(
+            lines, logger, min_lines=min_lines, tolerance=tolerance, xy=xy
         )
 
     @classmethod
@@ -238,7 +357,7 @@ class AxisGrid:
         *,
         min_lines: int = 4,
         tolerance: float = 1e-3,
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    ) -> Dict[str, List[Any]]:
         return cls.locate_line_spaces(
             dxf_path,
             grid_json,
@@ -254,113 +373,131 @@ class AxisGrid:
         *,
         min_lines: int,
         tolerance: float,
-    ) -> Dict[str, List[Dict[str, Any]]]:
-        line_geoms: List[Dict[str, Any]] = []
-        point_to_lines: Dict[Tuple[float, float], List[int]] = defaultdict(list)
-        point_coords: Dict[Tuple[float, float], Tuple[float, float]] = {}
-
-        for raw_index, line in enumerate(lines):
-            try:
-                sx = float(line["start_x"])
-                sy = float(line["start_y"])
-                ex = float(line["end_x"])
-                ey = float(line["end_y"])
-            except (KeyError, TypeError, ValueError):
-                logger.debug("跳过无效线条实体: %s", line)
-                continue
-
-            p1 = self._normalize_point(sx, sy, tolerance)
-            p2 = self._normalize_point(ex, ey, tolerance)
-            point_to_lines[p1].append(len(line_geoms))
-            point_to_lines[p2].append(len(line_geoms))
-            point_coords.setdefault(p1, (sx, sy))
-            point_coords.setdefault(p2, (ex, ey))
-
-            midpoint = ((sx + ex) / 2.0, (sy + ey) / 2.0)
-            line_geoms.append(
-                {
-                    "nodes": (p1, p2),
-                    "midpoint": midpoint,
-                    "start": (sx, sy),
-                    "end": (ex, ey),
-                    "layer": line.get("layer"),
-                    "raw_index": raw_index,
-                }
-            )
+        xy: Optional[Tuple[List[float], ...]] = None,
+    ) -> Dict[str, List[Any]]:
+        if tolerance <= 0:
+            raise ValueError("tolerance 必须大于 0")
+        snap = 1.0 / tolerance
 
-        if not line_geoms:
+        # 线段数据按列存放（下标即线段编号），避免每条线段构造一个字典
+        line_start: List[int] = []  # 起点端点编号
+        mid_xs: List[float] = []
+        mid_ys: List[float] = []
+        layers: List[Optional[str]] = []
+        raw_indices: List[int] = []
+        # 端点按容差归一后编号；parent/rank 为并查集，degree 为各端点连接的线段数。
+        # node_count/sum_x/sum_y/not_two 只在根节点上有意义：分量的端点数、坐标和
+        # 以及度数不为 2 的端点数，合并集合时随之累加，无需事后再遍历端点
+        node_ids: Dict[Tuple[int, int], int] = {}
+        parent: List[int] = []
+        rank: List[int] = []
+        degree: List[int] = []
+        node_count: List[int] = []
+        sum_x: List[float] = []
+        sum_y: List[float] = []
+        not_two: List[int] = []
+
+        def node_id(key: Tuple[int, int], x: float, y: float) -> int:
+            index = node_ids.get(key)
+            if index is None:
+                index = node_ids[key] = len(parent)
+                parent.append(index)
+                rank.append(0)
+                degree.append(0)
+                node_count.append(1)
+                sum_x.append(x)
+                sum_y.append(y)
+                not_two.append(1)
+            return index
+
+        def find(index: int) -> int:
+            root = index
+            while parent[root] != root:
+                root = parent[root]
+            # 路径压缩
+            while parent[index] != root:
+                parent[index], index = root, parent[index]
+            return root
+
+        if xy is not None:
+            coords = zip(range(len(lines)), *xy)
+        else:
+            coords = self._iter_line_coords(lines, logger)
+        for raw_index, sx, sy, ex, ey in coords:
+            line = lines[raw_index]
+            n1 = node_id(self._normalize_point(sx, sy, snap), sx, sy)
+            n2 = node_id(self._normalize_point(ex, ey, snap), ex, ey)
+            r1, r2 = find(n1), find(n2)
+
+            # 端点度数变为 2 或离开 2 时，更新所在分量的计数
+            for node, root in ((n1, r1), (n2, r2)):
+                d = degree[node] = degree[node] + 1
+                if d == 2:
+                    not_two[root] -= 1
+                elif d == 3:
+                    not_two[root] += 1
+
+            # 按秩合并线段两端所在的集合，并把统计量并入新的根节点
+            if r1 != r2:
+                if rank[r1] < rank[r2]:
+                    r1, r2 = r2, r1
+                parent[r2] = r1
+                if rank[r1] == rank[r2]:
+                    rank[r1] += 1
+                node_count[r1] += node_count[r2]
+                sum_x[r1] += sum_x[r2]
+                sum_y[r1] += sum_y[r2]
+                not_two[r1] += not_two[r2]
+
+            line_start.append(n1)
+            mid_xs.append((sx + ex) / 2.0)
+            mid_ys.append((sy + ey) / 2.0)
+            layers.append(line.get("layer"))
+            raw_indices.append(raw_index)
+
+        if not line_start:
             return {"closed_spaces": [], "open_lines": []}
 
-        closed_spaces: List[Dict[str, Any]] = []
-        open_lines: List[Dict[str, Any]] = []
-        visited: Set[int] = set()
-
-        for idx in range(len(line_geoms)):
-            if idx in visited:
-                continue
+        # 按根节点把线段分组；字典保持插入顺序，连通分量按其首条线段的顺序输出
+        components: Dict[int, List[int]] = defaultdict(list)
+        for line_idx, node in enumerate(line_start):
+            components[find(node)].append(line_idx)
 
-            component_lines: Set[int] = set()
-            component_nodes: Set[Tuple[float, float]] = set()
-            queue = deque([idx])
-
-            while queue:
-                line_idx = queue.popleft()
-                if line_idx in component_lines:
-                    continue
-                component_lines.add(line_idx)
-                node_a, node_b = line_geoms[line_idx]["nodes"]
-                component_nodes.update((node_a, node_b))
-                for neighbor in point_to_lines[node_a]:
-                    if neighbor not in component_lines:
-                        queue.append(neighbor)
-                for neighbor in point_to_lines[node_b]:
-                    if neighbor not in component_lines:
-                        queue.append(neighbor)
-
-            visited.update(component_lines)
-
-            node_degree: Dict[Tuple[float, float], int] = defaultdict(int)
-            for line_idx in component_lines:
-                node_a, node_b = line_geoms[line_idx]["nodes"]
-                node_degree[node_a] += 1
-                node_degree[node_b] += 1
+        closed_spaces: List[ClosedSpace] = []
+        open_lines: List[OpenLine] = []
+        locate = self._locate_labels
 
+        for root, component_lines in components.items():
+            nodes = node_count[root]
             is_closed = (
                 len(component_lines) >= min_lines
-                and len(component_nodes) >= min_lines
-                and all(degree == 2 for degree in node_degree.values())
+                and nodes >= min_lines
+                and not not_two[root]
             )
 
             if is_closed:
-                centroid_x = sum(
-                    point_coords[node][0] for node in component_nodes
-                ) / len(component_nodes)
-                centroid_y = sum(
-                    point_coords[node][1] for node in component_nodes
-                ) / len(component_nodes)
-                location = self.locate_point(centroid_x, centroid_y)
+                centroid_x = sum_x[root] / nodes
+                centroid_y = sum_y[root] / nodes
                 closed_spaces.append(
-                    {
-                        "line_count": len(component_lines),
-                        "node_count": len(component_nodes),
-                        "center_x": f"{centroid_x:.4f}",
-                        "center_y": f"{centroid_y:.4f}",
-                        **location,
-                    }
+                    ClosedSpace(
+                        len(component_lines),
+                        nodes,
+                        round(centroid_x, 4),
+                        round(centroid_y, 4),
+                        *locate(centroid_x, centroid_y),
+                    )
                 )
             else:
-                for line_idx in component_lines:
-                    midpoint = line_geoms[line_idx]["midpoint"]
-                    location = self.locate_point(midpoint[0], midpoint[1])
-                    open_lines.append(
-                        {
-                            "line_index": line_geoms[line_idx]["raw_index"],
-                            "layer": line_geoms[line_idx]["layer"],
-                            "mid_x": f"{midpoint[0]:.4f}",
-                            "mid_y": f"{midpoint[1]:.4f}",
-                            **location,
-                        }
+                open_lines.extend(
+                    OpenLine(
+                        raw_indices[line_idx],
+                        layers[line_idx],
+                        round(mid_xs[line_idx], 4),
+                        round(mid_ys[line_idx], 4),
+                        *locate(mid_xs[line_idx], mid_ys[line_idx]),
                     )
+                    for line_idx in component_lines
+                )
 
         logger.info(
             "闭合空间检测完成: 闭合空间 %d 个, 非闭合线段 %d 条",
@@ -370,11 +507,41 @@ class AxisGrid:
         return {"closed_spaces": closed_spaces, "open_lines": open_lines}
 
     @staticmethod
-    def _normalize_point(x: float, y: float, tolerance: float) -> Tuple[float, float]:
-        if tolerance <= 0:
-            raise ValueError("tolerance 必须大于 0")
-        snap = 1.0 / tolerance
-        return (round(x * snap) / snap, round(y * snap) / snap)
+    def _iter_line_coords(
+        lines: List[Dict[str, Any]], logger: logging.Logger
+    ) -> Iterator[Tuple[int, float, float, float, float]]:
+        """逐条解析线段端点，产出 (下标, 起点x, 起点y, 终点x, 终点y)，跳过无效线段"""
+        skipped = 0
+        debug = logger.isEnabledFor(logging.DEBUG)
+        keys = ("start_x", "start_y", "end_x", "end_y")
+        for raw_index, line in enumerate(lines):
+            values = [line.get(key) for key in keys]
+            # 坐标通常已是数值，仅对字符串等其它类型尝试转换
+            if not all(isinstance(value, _NUMBER_TYPES) for value in values):
+                try:
+                    values = [float(value) for value in values]  # type: ignore[arg-type]
+                except (TypeError, ValueError):
+                    skipped += 1
+                    if debug:
+                        logger.debug("跳过无效线条实体: %s", line)
+                    continue
+            yield (raw_index, *values)
+        if skipped:
+            logger.info("跳过 %d 条无效线条实体", skipped)
+
+    @staticmethod
+    def _normalize_point(x: float, y: float, snap: float) -> Tuple[int, int]:
+        """按容差把坐标吸附到网格，返回整数网格坐标 (snap = 1 / tolerance)
+
+        只用作端点的字典键，无需再除回浮点坐标；整数元组的哈希与比较也更快。
+        """
+        return round(x * snap), round(y * snap)
+
+
+@lru_cache(maxsize=8)
+def _load_grid_cached(cls: type, path: str, mtime_ns: int) -> AxisGrid:
+    # mtime_ns 参与缓存键，文件修改后会重新解析；AxisGrid 定位时只读，可安全共享
+    return cls.from_file(path)
 
 
 def extract_texts(dxf_path: str, logger: logging.Logger) -> List[Dict[str, Any]]:
@@ -397,32 +564,48 @@ def main() -> None:
     locator_cfg = config.get("grid_locator", {})
     log_cfg = locator_cfg.get("log", {})
 
+    paths = LocatorPaths.from_config(locator_cfg)
+
     log_level = parse_log_level(log_cfg.get("level"), default=logging.INFO)
-    log_file = resolve_path(log_cfg.get("file")) or os.path.join(
-        BASE_DIR, "logs", "grid_locator.log"
-    )
     filemode = log_cfg.get("filemode", "w")
 
-    setup_logger(log_level=log_level, log_file=log_file, filemode=filemode)
+    setup_logger(log_level=log_level, log_file=paths.log_file, filemode=filemode)
     logger = logging.getLogger(__name__)
 
-    dxf_path = resolve_path(locator_cfg.get("dxf_file"))
-    grid_json = resolve_path(locator_cfg.get("grid_json"))
-    output_csv = resolve_path(locator_cfg.get("output_csv"))
-
-    if not dxf_path or not os.path.exists(dxf_path):
+    dxf_path = paths.dxf_file
+    output_csv = paths.output_csv
+    # 文件是否存在由 DXFExtractor.open 检查
+    if not dxf_path:
         raise FileNotFoundError("配置中的 dxf_file 不存在，请检查 config.yaml")
-    if not grid_json or not os.path.exists(grid_json):
+    if not paths.grid_json:
         raise FileNotFoundError("配置中的 grid_json 不存在，请先运行 process_grid")
-    if not output_csv:
-        output_csv = os.path.join(BASE_DIR, "output", "text_positions.csv")
+
+    space_cfg = locator_cfg.get("space_detection", {})
+    detect_spaces = bool(space_cfg.get("enabled", True))
+
+    # 文字定位与闭合空间检测共用一次 DXF 解析和一份轴网数据；
+    # load_grid 读取文件时已检查存在性，无需事先再 stat 一次
+    try:
+        grid = AxisGrid.load_grid(paths.grid_json, logger)
+    except FileNotFoundError:
+        raise FileNotFoundError("配置中的 grid_json 不存在，请先运行 process_grid")
+    extractor = DXFExtractor(dxf_path)
+    extractor.extract(
+        {
+            "extract_text": True,
+            "extract_lines": detect_spaces,
+            "extract_rects": False,
+            "extract_circles": False,
+        }
+    )
 
     logger.info("开始处理 DXF 文字定位: %s", dxf_path)
-    AxisGrid.locate_texts_on_grid(dxf_path, grid_json, output_csv, logger)
+    texts = extractor.get_texts()
+    logger.info("共提取 %d 条文字元素", len(texts))
+    grid.locate_texts(texts, output_csv, logger, xy=extractor.get_texts_xy())
     logger.info("文字定位流程结束")
 
-    space_cfg = locator_cfg.get("space_detection", {})
-    if space_cfg.get("enabled", True):
+    if detect_spaces:
         min_lines = int(space_cfg.get("min_lines", 4))
         tolerance = float(space_cfg.get("tolerance", 1e-3))
         logger.info(
@@ -431,12 +614,12 @@ def main() -> None:
             tolerance,
         )
         try:
-            spaces_result = AxisGrid.locate_line_spaces(
-                dxf_path,
-                grid_json,
+            spaces_result = grid.locate_spaces(
+                extractor.get_lines(),
                 logger,
                 min_lines=min_lines,
                 tolerance=tolerance,
+                xy=extractor.get_lines_xy(),
             )
             closed_spaces = spaces_result.get("closed_spaces", [])
             open_lines = spaces_result.get("open_lines", [])
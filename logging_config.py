@@ -5,9 +5,12 @@
 """
 
 import logging
+import logging.handlers
+import multiprocessing
 import os
 import sys
-from typing import Optional
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Tuple
 
 # 动态添加项目根目录到 sys.path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -34,24 +37,31 @@ def setup_logger(
     # 创建日志文件夹
     os.makedirs(os.path.dirname(log_file), exist_ok=True)
 
-    # 配置日志格式
-    log_format = "%(asctime)s - %(levelname)s - %(module)s - %(message)s"
+    # 配置日志格式（两个处理器共用一个 Formatter）
+    formatter = logging.Formatter(
+        "%(asctime)s - %(levelname)s - %(module)s - %(message)s"
+    )
 
     # 设置日志级别
     app_logger = logging.getLogger()
     app_logger.setLevel(log_level)
 
-    # 清除已有的处理器，避免重复添加
-    if app_logger.handlers:
-        app_logger.handlers.clear()
+    # 移除并关闭已有的处理器，避免重复添加
+    for handler in list(app_logger.handlers):
+        app_logger.removeHandler(handler)
+        handler.close()
 
     # 控制台日志处理器
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter(log_format))
+    console_handler.setFormatter(formatter)
 
-    # 文件日志处理器
-    file_handler = logging.FileHandler(log_file, mode=filemode, encoding="utf-8")
-    file_handler.setFormatter(logging.Formatter(log_format))
+    # 文件日志处理器：首次写日志时才打开文件。每条日志直接写出、不做内存缓冲：
+    # 缓冲中的日志在进程被终止或在 COM 调用中崩溃时会丢失，
+    # 进程池工作进程经 os._exit 退出时也不会写出
+    file_handler = logging.FileHandler(
+        log_file, mode=filemode, encoding="utf-8", delay=True
+    )
+    file_handler.setFormatter(formatter)
 
     # 添加处理器
     app_logger.addHandler(console_handler)
@@ -60,6 +70,50 @@ def setup_logger(
     return app_logger
 
 
+def init_worker_logging(log_queue: Any, log_level: int) -> None:
+    """
+    进程池工作进程的初始化函数：日志经队列发回主进程。
+
+    fork 时工作进程继承了主进程的处理器，spawn 时则未配置任何处理器；
+    两种情况都改为只挂一个 QueueHandler，由主进程统一写出。
+
+    :param log_queue: forward_worker_logs() 提供的队列。
+    :param log_level: 工作进程的日志级别，与主进程一致。
+    """
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(log_level)
+
+
+@contextmanager
+def forward_worker_logs() -> Iterator[Tuple[Any, int]]:
+    """
+    在主进程中接收工作进程的日志，交给当前根记录器的处理器输出。
+
+    产出 init_worker_logging 的参数，用法：
+
+        with forward_worker_logs() as log_args, ProcessPoolExecutor(
+            initializer=init_worker_logging, initargs=log_args
+        ) as executor:
+            ...
+
+    进程池须在退出本上下文之前关闭，剩余日志在退出时全部写出。
+    """
+    root = logging.getLogger()
+    log_queue = multiprocessing.Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *root.handlers, respect_handler_level=True
+    )
+    listener.start()
+    try:
+        yield log_queue, root.level
+    finally:
+        listener.stop()
+        log_queue.close()
+
+
 # 单独运行时的测试代码
 if __name__ == "__main__":
     # 示例日志文件路径
@@ -1,10 +1,13 @@
+import copy
 import os
 import math
 import json
+import re
 import logging
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Dict, Any, Tuple, Optional
-from dataclasses import dataclass
-from collections import defaultdict
+from dataclasses import dataclass, field, replace
 
 try:
     import yaml
@@ -13,9 +16,15 @@ except ImportError as exc:  # pragma: no cover - dependency check
         "需要安装 PyYAML 才能解析 config.yaml，请执行 `pip install pyyaml`"
     ) from exc
 
-from dxf_extractor import DXFExtractor
+try:
+    import orjson
+except ImportError:  # 可选依赖，未安装时使用标准库 json 输出
+    orjson = None
+
 from logging_config import setup_logger
 
+# 优先使用 libyaml 的 C 实现加载器，未编译 libyaml 时回退到纯 Python 版本
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(BASE_DIR, "config.yaml")
@@ -27,12 +36,25 @@ DEFAULT_MIN_AXIS_LENGTH = 2000.0
 DEFAULT_SEARCH_RADIUS = 5000.0
 DEFAULT_LOG_FILE = "./logs/process_grid.log"
 
+# 轴号文本：1~4 个字母/数字/汉字，可带 "-" 分区后缀或 "/" 附加轴号，例如 "1"、"A"、"1-1"、"1/A"
+AXIS_LABEL_RE = re.compile(r"^[0-9A-Za-z\u4e00-\u9fff]{1,4}(?:[-/][0-9A-Za-z]{1,3})?$")
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime: float) -> Dict[str, Any]:
+    # mtime 参与缓存键，文件修改后会重新解析；
+    # 以二进制读取，编码由 YAML 解析器按 UTF-8/BOM 自行识别
+    with open(path, "rb", buffering=1 << 16) as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
 
 def _load_yaml(path: str) -> Dict[str, Any]:
-    if not os.path.exists(path):
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
         return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    # _deep_update 会原地修改结果，返回副本以免污染缓存
+    return copy.deepcopy(_load_yaml_cached(path, mtime))
 
 
 def _deep_update(target: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
@@ -68,10 +90,30 @@ def parse_log_level(level_name: Optional[str], default: int = logging.INFO) -> i
     return getattr(logging, level_name.upper(), default)
 
 
-@dataclass
+@lru_cache(maxsize=2)
+def _extract_dxf_cached(dxf_path: str, mtime_ns: int) -> Tuple[Any, ...]:
+    """提取轴网分析所需的 DXF 元素，同一文件未修改时复用上次结果
+
+    返回 (lines, texts, circles, lines_xy, texts_xy)；结果被多次调用共享，调用方不应修改。
+    """
+    # 延迟导入：只构建/读取轴网数据时无需加载 ezdxf
+    from dxf_extractor import DXFExtractor
+
+    extractor = DXFExtractor(dxf_path)
+    extractor.extract()
+    return (
+        extractor.get_lines(),
+        extractor.get_texts(),
+        extractor.get_circles(),
+        extractor.get_lines_xy(),
+        extractor.get_texts_xy(),
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class GridAxis:
     """
-    定义一根完整的建筑轴线
+    定义一根完整的建筑轴线 (不可变；修改轴号请使用 dataclasses.replace)
     """
 
     label: str  # 轴号 (例如 "1", "A", "1-1")
@@ -79,18 +121,31 @@ class GridAxis:
     end_point: Tuple[float, float]  # 轴线终点 (x, y)
     is_vertical: bool  # True=纵向轴线(定X), False=横向轴线(定Y)
     coordinate: float  # 排序用的主坐标值 (纵向为X值，横向为Y值)
+    # 轴线长度，构造时计算一次
+    length: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # frozen 数据类不能直接赋值，构造时通过 object.__setattr__ 写入
+        length = math.hypot(
+            self.end_point[0] - self.start_point[0],
+            self.end_point[1] - self.start_point[1],
+        )
+        object.__setattr__(self, "length", length)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为可序列化的字典 (端点为 [x, y] 列表)"""
+        return {
+            "label": self.label,
+            "start_point": list(self.start_point),
+            "end_point": list(self.end_point),
+            "is_vertical": self.is_vertical,
+            "coordinate": self.coordinate,
+        }
 
     def __repr__(self):
         dir_str = "纵" if self.is_vertical else "横"
         return f"<轴线 {self.label} [{dir_str}] @ {self.coordinate:.4f} (len={self.length:.2f})>"
 
-    @property
-    def length(self) -> float:
-        return math.sqrt(
-            (self.end_point[0] - self.start_point[0]) ** 2
-            + (self.end_point[1] - self.start_point[1]) ** 2
-        )
-
 
 class GridNetwork:
     """
@@ -112,33 +167,18 @@ class GridNetwork:
         self.raw_lines: List[Dict[str, Any]] = []
         self.raw_texts: List[Dict[str, Any]] = []
         self.raw_circles: List[Dict[str, Any]] = []
+        # 提取器给出的浮点坐标列，记录对应的原始列表，raw_* 被替换后不再使用
+        self._line_xy: Tuple[Any, Any] = (None, None)
+        self._text_xy: Tuple[Any, Any] = (None, None)
 
-        # 最终提取的轴线列表
-        self.axes: List[GridAxis] = []
+        # 最终提取的轴线列表 (赋值时同时生成按坐标排序的纵/横轴线列表)
+        self.axes = []
 
     def to_dict(self) -> Dict[str, Any]:
         """将轴网信息转换为可序列化的字典结构"""
         return {
-            "x_axes": [
-                {
-                    "label": a.label,
-                    "start_point": list(a.start_point),
-                    "end_point": list(a.end_point),
-                    "is_vertical": a.is_vertical,
-                    "coordinate": a.coordinate,
-                }
-                for a in self.x_axes
-            ],
-            "y_axes": [
-                {
-                    "label": a.label,
-                    "start_point": list(a.start_point),
-                    "end_point": list(a.end_point),
-                    "is_vertical": a.is_vertical,
-                    "coordinate": a.coordinate,
-                }
-                for a in self.y_axes
-            ],
+            "x_axes": [a.to_dict() for a in self.x_axes],
+            "y_axes": [a.to_dict() for a in self.y_axes],
         }
 
     def save_to_json(self, output_path: str) -> None:
@@ -151,24 +191,39 @@ class GridNetwork:
         if directory:
             os.makedirs(directory, exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            # orjson 直接生成 UTF-8 字节，非 ASCII 字符原样输出
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
 
         logger.info("已将轴网信息保存为 JSON: %s", output_path)
 
+    @property
+    def axes(self) -> List[GridAxis]:
+        return self._axes
+
+    @axes.setter
+    def axes(self, axes: List[GridAxis]) -> None:
+        # 排序结果在赋值时计算一次；如原地修改列表，需重新赋值 self.axes 以刷新
+        self._axes = axes
+        by_coordinate = attrgetter("coordinate")
+        self._x_axes = sorted((a for a in axes if a.is_vertical), key=by_coordinate)
+        self._y_axes = sorted(
+            (a for a in axes if not a.is_vertical), key=by_coordinate
+        )
+
     @property
     def x_axes(self) -> List[GridAxis]:
         """返回所有纵向轴线 (按 X 坐标排序)"""
-        return sorted(
-            [a for a in self.axes if a.is_vertical], key=lambda x: x.coordinate
-        )
+        return self._x_axes
 
     @property
     def y_axes(self) -> List[GridAxis]:
         """返回所有横向轴线 (按 Y 坐标排序)"""
-        return sorted(
-            [a for a in self.axes if not a.is_vertical], key=lambda x: x.coordinate
-        )
+        return self._y_axes
 
     def load_from_dxf(
         self, dxf_path: str, axis_layer_keywords: Optional[List[str]] = None
@@ -178,17 +233,22 @@ class GridNetwork:
         :param dxf_path: DXF 文件路径
         :param axis_layer_keywords: 轴线图层关键字列表，如 ['DOTE', 'AXIS']。如果为 None，则使用所有线。
         """
-        if not os.path.exists(dxf_path):
+        try:
+            mtime_ns = os.stat(dxf_path).st_mtime_ns
+        except OSError:
             self.logger.error("找不到文件: %s", dxf_path)
             raise FileNotFoundError(f"找不到文件: {dxf_path}")
 
         self.logger.info("正在加载轴网文件: %s ...", dxf_path)
-        extractor = DXFExtractor(dxf_path)
-        extractor.extract()
-
-        self.raw_lines = extractor.get_lines()
-        self.raw_texts = extractor.get_texts()
-        self.raw_circles = extractor.get_circles()
+        (
+            self.raw_lines,
+            self.raw_texts,
+            self.raw_circles,
+            line_xy,
+            text_xy,
+        ) = _extract_dxf_cached(os.path.abspath(dxf_path), mtime_ns)
+        self._line_xy = (self.raw_lines, line_xy)
+        self._text_xy = (self.raw_texts, text_xy)
 
         self.logger.info(
             "原始数据: %d 线条, %d 文本", len(self.raw_lines), len(self.raw_texts)
@@ -203,107 +263,96 @@ class GridNetwork:
         self.logger.info("正在分析轴网结构...")
 
         # 1. 过滤潜在的轴线 (根据图层关键字)
-        candidate_lines = []
+        # 端点坐标按列 (SoA) 存放，分组中只保存线段下标，不再为每条线段构造字典
+        line_columns = self._line_columns()
         if layer_keywords:
-            keywords = [k.upper() for k in layer_keywords]
-            for line in self.raw_lines:
-                layer = line.get("layer", "").upper()
-                if any(k in layer for k in keywords):
-                    candidate_lines.append(line)
+            # 多个关键字合并为一个正则，每个图层名只扫描一次
+            search = re.compile(
+                "|".join(re.escape(k.upper()) for k in layer_keywords)
+            ).search
+            keep = [
+                i
+                for i, line in enumerate(self.raw_lines)
+                if search(line.get("layer", "").upper())
+            ]
+            start_xs, start_ys, end_xs, end_ys = (
+                [column[i] for i in keep] for column in line_columns
+            )
         else:
             # 如果没指定图层，使用所有线条 (可能会有干扰，建议指定)
-            candidate_lines = self.raw_lines
+            start_xs, start_ys, end_xs, end_ys = line_columns
 
-        self.logger.info("筛选出 %d 条潜在轴线段", len(candidate_lines))
+        self.logger.info("筛选出 %d 条潜在轴线段", len(start_xs))
 
         # 2. 线条聚类 (合并共线线段)
         # 容差值 (单位: 图纸单位，通常是mm)
         tolerance = self.tolerance
 
-        vertical_groups = defaultdict(list)  # Key: round(x), Value: list of lines
-        horizontal_groups = defaultdict(list)  # Key: round(y), Value: list of lines
-
-        for line in candidate_lines:
-            # 注意：dxf_extractor 返回的已经是字符串格式的数字了，需要转回 float 计算
-            try:
-                x1 = float(line["start_x"])
-                y1 = float(line["start_y"])
-                x2 = float(line["end_x"])
-                y2 = float(line["end_y"])
-            except ValueError:
+        # 每组在分组时直接累计 [跨度最小值, 跨度最大值, 两端主坐标之和, 线段数]，
+        # 每个坐标只访问一次，不再收集端点列表
+        # Key: (是否纵向, 归一化主坐标)，纵横两个方向共用一个字典
+        groups: Dict[Tuple[bool, float], List[float]] = {}
+        # 重复的线段 (图块、外部参照、复制粘贴) 只计一次，不影响平均坐标
+        seen_segments = set()
+        duplicates = 0
+
+        for x1, y1, x2, y2 in zip(start_xs, start_ys, end_xs, end_ys):
+            # 判断方向 (坐标无法解析的线段为 NaN，两个条件都不成立)
+            if abs(x1 - x2) < 1.0:  # 垂直线：按 X 分组，跨度为 Y
+                is_vertical, coord_sum, lo, hi = True, x1 + x2, y1, y2
+            elif abs(y1 - y2) < 1.0:  # 水平线：按 Y 分组，跨度为 X
+                is_vertical, coord_sum, lo, hi = False, y1 + y2, x1, x2
+            else:
                 continue
 
-            # 判断方向
-            if abs(x1 - x2) < 1.0:  # 垂直线
-                key = round((x1 + x2) / 2 / tolerance) * tolerance  # 归一化坐标
-                vertical_groups[key].append(
-                    {"start_x": x1, "start_y": y1, "end_x": x2, "end_y": y2}
-                )
-            elif abs(y1 - y2) < 1.0:  # 水平线
-                key = round((y1 + y2) / 2 / tolerance) * tolerance
-                horizontal_groups[key].append(
-                    {"start_x": x1, "start_y": y1, "end_x": x2, "end_y": y2}
-                )
-
-        # 3. 构建逻辑轴线 (不含标签)
-        temp_axes: List[GridAxis] = []
-
-        # 处理纵向轴线
-        for x_key, lines in vertical_groups.items():
-            # 找到这组线的最小Y和最大Y
-            ys = []
-            for line_data in lines:
-                ys.append(line_data["start_y"])
-                ys.append(line_data["end_y"])
-
-            if not ys:
+            segment = (x1, y1, x2, y2) if (x1, y1) <= (x2, y2) else (x2, y2, x1, y1)
+            if segment in seen_segments:
+                duplicates += 1
                 continue
+            seen_segments.add(segment)
+
+            if hi < lo:
+                lo, hi = hi, lo
+            # 归一化坐标
+            key = (is_vertical, round(coord_sum / 2 / tolerance) * tolerance)
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [lo, hi, coord_sum, 1]
+            else:
+                if lo < group[0]:
+                    group[0] = lo
+                if hi > group[1]:
+                    group[1] = hi
+                group[2] += coord_sum
+                group[3] += 1
+
+        if duplicates:
+            self.logger.info("忽略 %d 条重复线段", duplicates)
+
+        # 3. 构建逻辑轴线 (不含标签)，按分组首次出现的顺序
+        temp_axes: List[GridAxis] = []
 
-            min_y, max_y = min(ys), max(ys)
-            # 计算平均 X 坐标
-            avg_x = sum(
-                line_data["start_x"] + line_data["end_x"] for line_data in lines
-            ) / (2 * len(lines))
-
+        for (is_vertical, _), (low, high, coord_sum, count) in groups.items():
             # 忽略太短的轴线 (例如小于 2米)
-            if abs(max_y - min_y) < self.min_axis_length:
-                continue
-
-            axis = GridAxis(
-                label="?",
-                start_point=(avg_x, min_y),
-                end_point=(avg_x, max_y),
-                is_vertical=True,
-                coordinate=avg_x,
-            )
-            temp_axes.append(axis)
-
-        # 处理横向轴线
-        for y_key, lines in horizontal_groups.items():
-            xs = []
-            for line_data in lines:
-                xs.append(line_data["start_x"])
-                xs.append(line_data["end_x"])
-
-            if not xs:
-                continue
-
-            min_x, max_x = min(xs), max(xs)
-            avg_y = sum(
-                line_data["start_y"] + line_data["end_y"] for line_data in lines
-            ) / (2 * len(lines))
-
-            if abs(max_x - min_x) < self.min_axis_length:
+            if abs(high - low) < self.min_axis_length:
                 continue
 
-            axis = GridAxis(
-                label="?",
-                start_point=(min_x, avg_y),
-                end_point=(max_x, avg_y),
-                is_vertical=False,
-                coordinate=avg_y,
+            # 平均主坐标 (纵向为 X，横向为 Y)
+            coordinate = coord_sum / (2 * count)
+            if is_vertical:
+                start_point, end_point = (coordinate, low), (coordinate, high)
+            else:
+                start_point, end_point = (low, coordinate), (high, coordinate)
+
+            temp_axes.append(
+                GridAxis(
+                    label="?",
+                    start_point=start_point,
+                    end_point=end_point,
+                    is_vertical=is_vertical,
+                    coordinate=coordinate,
+                )
             )
-            temp_axes.append(axis)
 
         self.logger.info("合并后得到 %d 条逻辑轴线，正在匹配轴号...", len(temp_axes))
 
@@ -311,43 +360,53 @@ class GridNetwork:
         # 搜索半径 (例如 5000mm，涵盖轴号圈的大小)
         search_radius = self.search_radius
 
-        matched_count = 0
-        for axis in temp_axes:
-            # 寻找距离起点或终点最近的文本
-            best_label = None
-            min_dist = float("inf")
-
-            # 检查所有文本
-            for text in self.raw_texts:
-                try:
-                    tx = float(text["x"])
-                    ty = float(text["y"])
-                except ValueError:
+        # 候选文本只筛选、解析一次，按边长为搜索半径的网格分桶：与端点距离小于
+        # 半径的文本必然落在端点所在格及相邻 8 格内。order 为原始顺序，距离相同时取靠前者
+        buckets: Dict[Tuple[int, int], List[Tuple[int, float, float, str]]] = {}
+        if search_radius > 0:
+            is_axis_label = AXIS_LABEL_RE.match
+            for order, (text, tx, ty) in enumerate(
+                zip(self.raw_texts, *self._text_columns())
+            ):
+                if not (math.isfinite(tx) and math.isfinite(ty)):  # 坐标无法解析
                     continue
 
                 content = text["content"].strip()
 
-                # 过滤掉非轴号的文本 (简单的长度过滤，轴号通常很短)
-                if len(content) > 8:
+                # 过滤掉非轴号的文本 (说明文字、标注等)
+                if not is_axis_label(content):
                     continue
 
-                # 计算到起点的距离
-                d1 = math.sqrt(
-                    (tx - axis.start_point[0]) ** 2 + (ty - axis.start_point[1]) ** 2
-                )
-                # 计算到终点的距离
-                d2 = math.sqrt(
-                    (tx - axis.end_point[0]) ** 2 + (ty - axis.end_point[1]) ** 2
-                )
+                cell = (int(tx // search_radius), int(ty // search_radius))
+                buckets.setdefault(cell, []).append((order, tx, ty, content))
 
-                dist = min(d1, d2)
+        # 只比较大小，使用距离的平方，省去开方
+        radius_sq = search_radius * search_radius
+        neighbours = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
 
-                if dist < search_radius and dist < min_dist:
-                    min_dist = dist
-                    best_label = content
+        matched_count = 0
+        # 没有候选文本 (或搜索半径不为正) 时无需逐轴查找
+        for index, axis in enumerate(temp_axes if buckets else []):
+            # 寻找距离起点或终点最近的文本
+            best_label = None
+            best_order = -1
+            min_dist_sq = radius_sq
+
+            for px, py in (axis.start_point, axis.end_point):
+                cx, cy = int(px // search_radius), int(py // search_radius)
+                for dx, dy in neighbours:
+                    for order, tx, ty, content in buckets.get((cx + dx, cy + dy), ()):
+                        ddx, ddy = tx - px, ty - py
+                        dist_sq = ddx * ddx + ddy * ddy
+                        if dist_sq < min_dist_sq or (
+                            dist_sq == min_dist_sq and order < best_order
+                        ):
+                            min_dist_sq = dist_sq
+                            best_order = order
+                            best_label = content
 
             if best_label:
-                axis.label = best_label
+                temp_axes[index] = replace(axis, label=best_label)
                 matched_count += 1
 
         # 5. 保存结果 (按坐标排序)
@@ -358,27 +417,94 @@ class GridNetwork:
             matched_count,
         )
 
+    def _line_columns(self) -> Tuple[List[float], ...]:
+        """返回与 raw_lines 一一对应的 (start_xs, start_ys, end_xs, end_ys)
+
+        load_from_dxf 载入时直接使用提取器的浮点坐标列；否则逐条解析，
+        无法解析的线段四个坐标均记为 NaN。
+        """
+        source, columns = self._line_xy
+        if source is self.raw_lines:
+            return columns
+
+        nan = float("nan")
+        start_xs: List[float] = []
+        start_ys: List[float] = []
+        end_xs: List[float] = []
+        end_ys: List[float] = []
+        for line in self.raw_lines:
+            try:
+                x1 = float(line["start_x"])
+                y1 = float(line["start_y"])
+                x2 = float(line["end_x"])
+                y2 = float(line["end_y"])
+            except ValueError:
+                x1 = y1 = x2 = y2 = nan
+            start_xs.append(x1)
+            start_ys.append(y1)
+            end_xs.append(x2)
+            end_ys.append(y2)
+        return start_xs, start_ys, end_xs, end_ys
+
+    def _text_columns(self) -> Tuple[List[float], List[float]]:
+        """返回与 raw_texts 一一对应的 (xs, ys)，无法解析的坐标记为 NaN"""
+        source, columns = self._text_xy
+        if source is self.raw_texts:
+            return columns
+
+        nan = float("nan")
+        xs: List[float] = []
+        ys: List[float] = []
+        for text in self.raw_texts:
+            try:
+                x = float(text["x"])
+                y = float(text["y"])
+            except ValueError:
+                x = y = nan
+            xs.append(x)
+            ys.append(y)
+        return xs, ys
+
     def print_grid_info(self):
         """打印轴网信息（通过日志输出表格形式）"""
         logger = logging.getLogger(__name__)
+        # INFO 被过滤时整张表都不会输出，直接返回，省去逐行创建日志记录
+        if not logger.isEnabledFor(logging.INFO):
+            return
 
         logger.info("\n%s", "=" * 30)
         logger.info("      建筑轴网信息表")
         logger.info("%s", "=" * 30)
 
-        logger.info("\n[纵向轴线 (X定位)] 共 %d 条", len(self.x_axes))
-        logger.info("%s", f"{'轴号':<8} {'X坐标':<12} {'范围 (Y1 -> Y2)'}")
+        # 每个方向的表体拼成一条日志输出，避免逐行调用 handler
+        row_format = "%-8s %-12.4f %.1f -> %.1f"
+        x_axes = self.x_axes
+        logger.info("\n[纵向轴线 (X定位)] 共 %d 条", len(x_axes))
+        logger.info("%-8s %-12s %s", "轴号", "X坐标", "范围 (Y1 -> Y2)")
         logger.info("%s", "-" * 40)
-        for axis in self.x_axes:
-            y_range = f"{axis.start_point[1]:.1f} -> {axis.end_point[1]:.1f}"
-            logger.info("%s", f"{axis.label:<8} {axis.coordinate:<12.4f} {y_range}")
+        if x_axes:
+            logger.info(
+                "%s",
+                "\n".join(
+                    row_format
+                    % (a.label, a.coordinate, a.start_point[1], a.end_point[1])
+                    for a in x_axes
+                ),
+            )
 
-        logger.info("\n[横向轴线 (Y定位)] 共 %d 条", len(self.y_axes))
-        logger.info("%s", f"{'轴号':<8} {'Y坐标':<12} {'范围 (X1 -> X2)'}")
+        y_axes = self.y_axes
+        logger.info("\n[横向轴线 (Y定位)] 共 %d 条", len(y_axes))
+        logger.info("%-8s %-12s %s", "轴号", "Y坐标", "范围 (X1 -> X2)")
         logger.info("%s", "-" * 40)
-        for axis in self.y_axes:
-            x_range = f"{axis.start_point[0]:.1f} -> {axis.end_point[0]:.1f}"
-            logger.info("%s", f"{axis.label:<8} {axis.coordinate:<12.4f} {x_range}")
+        if y_axes:
+            logger.info(
+                "%s",
+                "\n".join(
+                    row_format
+                    % (a.label, a.coordinate, a.start_point[0], a.end_point[0])
+                    for a in y_axes
+                ),
+            )
         logger.info("%s\n", "=" * 30)
 
 
@@ -2,11 +2,13 @@
 测试 dwg_extractor.py 模块。
 
 验证 DWG 元素提取功能是否正常工作。
+设置环境变量 TEST_DEBUG=1 可在提取失败时输出完整堆栈。
 """
 
 import logging
+import os
 import sys
-from dwg_extractor import DWGExtractor
+from _test_fixtures import get_dwg_extractor, load_dwg, load_dwg_all_elements
 from logging_config import setup_logger
 
 
@@ -29,10 +31,10 @@ def test_dwg_extractor():
     print(f"\n测试文件: {dwg_file}")
     print("-" * 70)
 
-    # 创建提取器
+    # 创建提取器（各测试共用同一实例）
     print("\n[1/5] 创建 DWGExtractor 实例...")
     try:
-        extractor = DWGExtractor()
+        get_dwg_extractor()
         print("✓ DWGExtractor 创建成功")
     except Exception as e:
         print(f"✗ 创建失败: {e}")
@@ -41,9 +43,7 @@ def test_dwg_extractor():
     # 测试连接和提取
     print("\n[2/5] 连接 AutoCAD 并打开文件...")
     try:
-        elements_dict = extractor.extract_from_file(
-            dwg_file, extract_config={}  # 使用默认配置
-        )
+        elements_dict = load_dwg(dwg_file)  # 使用默认配置
         print("✓ 文件提取成功")
     except FileNotFoundError as e:
         print(f"✗ 文件不存在: {e}")
@@ -57,10 +57,12 @@ def test_dwg_extractor():
         print("  3. COM 接口问题")
         return False
     except Exception as e:
-        print(f"✗ 提取失败: {e}")
-        import traceback
+        print(f"✗ 提取失败: {type(e).__name__}: {e}")
+        # 完整堆栈仅在设置 TEST_DEBUG 环境变量时输出
+        if os.environ.get("TEST_DEBUG"):
+            import traceback
 
-        traceback.print_exc()
+            traceback.print_exc()
         return False
 
     # 检查提取结果
@@ -139,18 +141,22 @@ def test_dwg_extractor():
         print(f"✗ 显示数据失败: {e}")
         return False
 
-    # 测试 get_all_elements 方法
+    # 测试 get_all_elements 方法：取与 elements_dict 同一次提取的结果，
+    # 共享提取器的当前状态可能已被其他提取覆盖
     print("\n[5/5] 测试 get_all_elements() 方法...")
     try:
-        all_elements = extractor.get_all_elements()
+        all_elements = load_dwg_all_elements(dwg_file)
         print(f"✓ get_all_elements() 返回 {len(all_elements)} 个元素")
 
-        # 验证扁平列表的正确性
-        expected_total = len(texts) + len(lines) + len(rects) + len(circles)
-        if len(all_elements) == expected_total:
-            print("✓ 元素数量匹配")
-        else:
-            print(f"⚠ 元素数量不匹配: 期望 {expected_total}, 实际 {len(all_elements)}")
+        # 验证扁平列表的正确性：按 文本/线条/矩形/圆形 顺序拼接，与分类结果一致
+        expected = texts + lines + rects + circles
+        if len(all_elements) != len(expected):
+            print(f"✗ 元素数量不匹配: 期望 {len(expected)}, 实际 {len(all_elements)}")
+            return False
+        if all_elements != expected:
+            print("✗ 元素内容或顺序与分类结果不一致")
+            return False
+        print("✓ 元素数量与内容匹配")
     except Exception as e:
         print(f"✗ 测试 get_all_elements() 失败: {e}")
         return False
@@ -170,7 +176,6 @@ def test_custom_config():
     print("=" * 70)
 
     setup_logger(log_level=logging.INFO)
-    extractor = DWGExtractor()
     dwg_file = "input/test.dwg"
 
     # 只提取文本
@@ -185,7 +190,7 @@ def test_custom_config():
     }
 
     try:
-        elements_dict = extractor.extract_from_file(dwg_file, config)
+        elements_dict = load_dwg(dwg_file, config)
 
         texts = len(elements_dict.get("texts", []))
         lines = len(elements_dict.get("lines", []))
@@ -1,11 +1,12 @@
 """
 DXF 提取器测试脚本
 测试 dxf_extractor.py 模块的功能
+设置环境变量 TEST_DEBUG=1 可在测试失败时输出完整堆栈
 """
 
 import os
 import sys
-from dxf_extractor import DXFExtractor
+from _test_fixtures import load_dxf
 
 
 def print_section(title):
@@ -22,24 +23,20 @@ def test_dxf_extractor():
     # 测试文件
     test_file = "input/test.dxf"
 
-    # 检查测试文件是否存在
-    if not os.path.exists(test_file):
-        print(f"⚠ 测试文件不存在: {test_file}")
-        print("请将 DXF 文件放入 input/ 目录")
-        return False
-
     print("测试文件: {}".format(test_file))
     print("-" * 70)
 
     try:
-        # 创建提取器
-        print("[1/5] 创建 DXFExtractor 实例...")
-        extractor = DXFExtractor()
-        print("✓ DXFExtractor 创建成功\n")
-
-        # 提取所有元素
+        # 打开文件并提取所有元素（同一进程内共用提取结果）
+        print("[1/5] 打开 DXF 文件...")
         print("[2/5] 提取所有类型的元素...")
-        elements = extractor.extract_from_file(test_file)
+        try:
+            extractor = load_dxf(test_file)
+        except FileNotFoundError:
+            print(f"⚠ 测试文件不存在: {test_file}")
+            print("请将 DXF 文件放入 input/ 目录")
+            return False
+        elements = extractor.elements
         print("✓ 文件提取成功\n")
 
         # 检查提取的元素
@@ -116,23 +113,25 @@ def test_dxf_extractor():
         output_file = "output/dxf_test_elements.csv"
         extractor.save_to_csv(output_file)
 
-        if os.path.exists(output_file):
+        try:
             file_size = os.path.getsize(output_file)
-            print(f"✓ CSV 文件已保存: {output_file}")
-            print(f"  文件大小: {file_size} 字节\n")
-        else:
+        except FileNotFoundError:
             print("✗ CSV 文件保存失败\n")
             return False
+        print(f"✓ CSV 文件已保存: {output_file}")
+        print(f"  文件大小: {file_size} 字节\n")
 
         print_section("✓ 所有测试通过!")
         print("\ndxf_extractor.py 模块工作正常。\n")
         return True
 
     except Exception as e:
-        print(f"\n✗ 测试失败: {e}")
-        import traceback
+        print(f"\n✗ 测试失败: {type(e).__name__}: {e}")
+        # 完整堆栈仅在设置 TEST_DEBUG 环境变量时输出
+        if os.environ.get("TEST_DEBUG"):
+            import traceback
 
-        traceback.print_exc()
+            traceback.print_exc()
         return False
 
 
@@ -142,16 +141,10 @@ def test_custom_config():
 
     test_file = "input/test.dxf"
 
-    if not os.path.exists(test_file):
-        print(f"⚠ 测试文件不存在: {test_file}")
-        return True  # 跳过测试
-
     print("测试配置: 仅提取文本元素")
     print("-" * 70)
 
     try:
-        extractor = DXFExtractor()
-
         # 自定义配置 - 只提取文本
         config = {
             "extract_text": True,
@@ -160,7 +153,11 @@ def test_custom_config():
             "extract_circles": False,
         }
 
-        elements = extractor.extract_from_file(test_file, config)
+        try:
+            elements = load_dxf(test_file, config).elements
+        except FileNotFoundError:
+            print(f"⚠ 测试文件不存在: {test_file}")
+            return True  # 跳过测试
 
         print(f"文本元素: {len(elements['texts'])} 个")
         print(f"线条元素: {len(elements['lines'])} 个")
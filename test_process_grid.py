@@ -0,0 +1,83 @@
+"""
+测试 process_grid.py 模块的轴号识别
+
+使用内存中构造的线条与文本，无需 DXF 文件
+"""
+
+import sys
+
+from process_grid import AXIS_LABEL_RE, GridNetwork
+
+
+def print_section(title):
+    """打印分隔线"""
+    print("\n" + "=" * 70)
+    print(title)
+    print("=" * 70 + "\n")
+
+
+def test_axis_label_re():
+    """测试轴号文本的匹配规则"""
+    print_section("测试轴号文本匹配")
+
+    accepted = ["1", "A", "12", "1-1", "A-2", "1/A", "1/01", "A/3"]
+    rejected = ["", "说明文字过长的标注", "1/", "-1", "1//A", "1/ABCD", "12345"]
+
+    ok = True
+    for content in accepted:
+        if AXIS_LABEL_RE.match(content):
+            print(f"✓ 识别为轴号: {content!r}")
+        else:
+            print(f"✗ 应识别为轴号: {content!r}")
+            ok = False
+    for content in rejected:
+        if AXIS_LABEL_RE.match(content):
+            print(f"✗ 不应识别为轴号: {content!r}")
+            ok = False
+        else:
+            print(f"✓ 非轴号: {content!r}")
+    return ok
+
+
+def test_label_matching():
+    """测试轴线端点附近的附加轴号 (如 1/A) 能被关联到轴线"""
+    print_section("测试轴号关联")
+
+    grid = GridNetwork(tolerance=100.0, min_axis_length=2000.0, search_radius=5000.0)
+    grid.raw_lines = [
+        # 纵向轴线 x=0 与 x=6000，横向附加轴线 y=3000
+        {"start_x": 0.0, "start_y": 0.0, "end_x": 0.0, "end_y": 20000.0, "layer": "AXIS"},
+        {"start_x": 6000.0, "start_y": 0.0, "end_x": 6000.0, "end_y": 20000.0, "layer": "AXIS"},
+        {"start_x": -2000.0, "start_y": 3000.0, "end_x": 8000.0, "end_y": 3000.0, "layer": "AXIS"},
+    ]
+    grid.raw_texts = [
+        {"content": "1", "x": 0.0, "y": -1500.0},
+        {"content": "2", "x": 6000.0, "y": -1500.0},
+        {"content": "1/A", "x": -3500.0, "y": 3000.0},
+    ]
+    grid._analyze_structure(["AXIS"])
+
+    labels = sorted(axis.label for axis in grid.axes)
+    print(f"识别到的轴号: {labels}")
+    if labels == ["1", "1/A", "2"]:
+        print("✓ 轴号关联正确")
+        return True
+    print("✗ 轴号关联不正确，期望: ['1', '1/A', '2']")
+    return False
+
+
+def main():
+    """主测试流程"""
+    test1_passed = test_axis_label_re()
+    test2_passed = test_label_matching()
+
+    print_section("测试总结")
+    print(f"轴号匹配测试: {'✓ 通过' if test1_passed else '✗ 失败'}")
+    print(f"轴号关联测试: {'✓ 通过' if test2_passed else '✗ 失败'}")
+    print("=" * 70)
+
+    return 0 if (test1_passed and test2_passed) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())